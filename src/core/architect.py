@@ -30,10 +30,14 @@ import base64
 import json
 import os
 import re
+import struct
+import zlib
+from collections.abc import Callable, Iterable, Iterator
 from pathlib import Path
 
 import requests
 from pydantic import ValidationError
+from requests.adapters import HTTPAdapter
 from rich.console import Console
 
 from src.domain.models import GantryManifest
@@ -46,6 +50,10 @@ MISSIONS_DIR = Path(__file__).parent.parent.parent / "missions"
 # Bedrock API configuration
 BEDROCK_REGION = os.getenv("BEDROCK_REGION", "us-east-1")
 BEDROCK_ENDPOINT = f"https://bedrock-runtime.{BEDROCK_REGION}.amazonaws.com"
+# Keep-alive connections kept per Architect (shared by concurrent missions)
+BEDROCK_POOL_SIZE = int(os.getenv("GANTRY_BEDROCK_POOL_SIZE", "8"))
+# Streamed drafts report progress each time this many more characters arrive
+STREAM_PROGRESS_CHARS = 2000
 
 # =============================================================================
 # 3-TIER MODEL ARCHITECTURE (Robust Multi-Model Fallback)
@@ -1280,6 +1288,45 @@ class ArchitectError(Exception):
     pass
 
 
+class ArchitectUnavailableError(ArchitectError):
+    """Raised when Bedrock itself kept failing (timeouts, connection errors, 429/5xx)."""
+
+    pass
+
+
+def _iter_event_payloads(chunks: Iterable[bytes]) -> Iterator[dict]:
+    """
+    Decode the JSON payloads of an AWS event-stream response body.
+
+    Each frame is a 12-byte prelude (total length, headers length, prelude
+    CRC), the headers, the payload and a 4-byte message CRC. Both CRCs are
+    checked so a truncated or garbled frame is rejected instead of parsed.
+
+    Raises:
+        ValueError: If a frame is malformed or fails its CRC check.
+    """
+    buffer = bytearray()
+    for chunk in chunks:
+        buffer += chunk
+        while len(buffer) >= 12:
+            total_length, headers_length, prelude_crc = struct.unpack_from(">III", buffer)
+            if zlib.crc32(buffer[:8]) != prelude_crc:
+                raise ValueError("Event-stream prelude CRC mismatch")
+            if total_length < 16 or headers_length > total_length - 16:
+                raise ValueError(f"Malformed event-stream frame length {total_length}")
+            if len(buffer) < total_length:
+                break
+            (message_crc,) = struct.unpack_from(">I", buffer, total_length - 4)
+            if zlib.crc32(buffer[: total_length - 4]) != message_crc:
+                raise ValueError("Event-stream message CRC mismatch")
+            payload = bytes(buffer[12 + headers_length : total_length - 4])
+            del buffer[:total_length]
+            if payload:
+                yield json.loads(payload)
+    if buffer:
+        raise ValueError(f"Event stream ended mid-frame ({len(buffer)} bytes left)")
+
+
 class Architect:
     """
     The AI Brain that translates voice memos into Fabrication Instructions.
@@ -1306,8 +1353,19 @@ class Architect:
             console.print("[red][ARCHITECT] BEDROCK_API_KEY not found[/red]")
             raise ArchitectError("BEDROCK_API_KEY environment variable not set")
 
+        # Pooled keep-alive session: heal retries and parallel missions reuse
+        # TCP/TLS connections. No adapter-level retries; our own loop retries.
+        self._session = requests.Session()
+        self._session.mount(
+            "https://", HTTPAdapter(pool_connections=1, pool_maxsize=BEDROCK_POOL_SIZE)
+        )
+
         console.print(f"[green][ARCHITECT] Brain online (region: {self._region})[/green]")
 
+    def close(self) -> None:
+        """Close the pooled Bedrock HTTP connections."""
+        self._session.close()
+
     def _clean_json(self, text: str) -> str:
         """
         Extract valid JSON from Claude's response.
@@ -1401,6 +1459,8 @@ class Architect:
         user_content: str | list,
         max_tokens: int = 4096,
         retry_count: int = 2,
+        *,
+        progress: Callable[[str], None] | None = None,
     ) -> str:
         """
         Call a specific Claude model via Bedrock API with retry logic.
@@ -1411,6 +1471,8 @@ class Architect:
             user_content: The user message (text or multimodal content).
             max_tokens: Maximum tokens to generate.
             retry_count: Number of retries on transient failures.
+            progress: Optional listener; when given, the response is streamed
+                and the listener hears how much of it has arrived.
 
         Returns:
             Raw text response from the model.
@@ -1420,11 +1482,16 @@ class Architect:
         """
         import time
 
-        url = f"{self._endpoint}/model/{model_id}/invoke"
+        if progress is None:
+            url = f"{self._endpoint}/model/{model_id}/invoke"
+            accept = "application/json"
+        else:
+            url = f"{self._endpoint}/model/{model_id}/invoke-with-response-stream"
+            accept = "application/vnd.amazon.eventstream"
 
         headers = {
             "Content-Type": "application/json",
-            "Accept": "application/json",
+            "Accept": accept,
             "Authorization": f"Bearer {self._api_key}",
         }
 
@@ -1446,26 +1513,43 @@ class Architect:
                     )
                     time.sleep(wait_time)
 
-                response = requests.post(url, headers=headers, json=body, timeout=120)
-
-                # Handle rate limiting with retry
-                if response.status_code == 429:
-                    last_error = "Rate limited (429)"
-                    console.print("[yellow][ARCHITECT] Rate limited, will retry...[/yellow]")
-                    continue
+                response = self._session.post(
+                    url, headers=headers, json=body, timeout=120, stream=progress is not None
+                )
 
-                # Handle server errors with retry
-                if response.status_code >= 500:
-                    last_error = f"Server error ({response.status_code})"
-                    console.print(f"[yellow][ARCHITECT] {last_error}, will retry...[/yellow]")
-                    continue
+                # Closing matters when streaming: a response left open on retry
+                # or error keeps its pooled connection checked out
+                with response:
+                    # Handle rate limiting with retry
+                    if response.status_code == 429:
+                        last_error = "Rate limited (429)"
+                        console.print("[yellow][ARCHITECT] Rate limited, will retry...[/yellow]")
+                        continue
+
+                    # Handle server errors with retry
+                    if response.status_code >= 500:
+                        last_error = f"Server error ({response.status_code})"
+                        console.print(f"[yellow][ARCHITECT] {last_error}, will retry...[/yellow]")
+                        continue
+
+                    # Client errors are not retryable
+                    if response.status_code != 200:
+                        raise ArchitectError(
+                            f"API error {response.status_code}: {response.text[:500]}"
+                        )
 
-                # Client errors are not retryable
-                if response.status_code != 200:
-                    raise ArchitectError(f"API error {response.status_code}: {response.text[:500]}")
+                    if progress is not None:
+                        try:
+                            return self._read_stream(response, progress)
+                        except (requests.RequestException, ValueError) as e:
+                            last_error = f"Stream interrupted: {e}"
+                            console.print(
+                                f"[yellow][ARCHITECT] {last_error}, will retry...[/yellow]"
+                            )
+                            continue
 
-                response_body = response.json()
-                return response_body["content"][0]["text"]
+                    response_body = response.json()
+                    return response_body["content"][0]["text"]
 
             except requests.Timeout:
                 last_error = "Request timeout"
@@ -1478,7 +1562,52 @@ class Architect:
                 continue
 
         # All retries exhausted
-        raise ArchitectError(f"API call failed after {retry_count + 1} attempts: {last_error}")
+        raise ArchitectUnavailableError(
+            f"API call failed after {retry_count + 1} attempts: {last_error}"
+        )
+
+    def _read_stream(self, response: requests.Response, progress: Callable[[str], None]) -> str:
+        """
+        Collect the text of a streamed model response, reporting as it arrives.
+
+        Args:
+            response: An open streaming response from invoke-with-response-stream.
+            progress: Listener for progress lines; a failing listener is ignored.
+
+        Returns:
+            The full text the model generated.
+
+        Raises:
+            ArchitectError: If Bedrock sends an exception frame mid-stream.
+            ValueError: If a frame is malformed or its payload isn't JSON.
+            requests.RequestException: If the connection drops mid-stream.
+        """
+
+        def _report(line: str) -> None:
+            try:
+                progress(line)
+            except Exception:
+                pass
+
+        parts: list[str] = []
+        received = 0
+        next_report = STREAM_PROGRESS_CHARS
+        for payload in _iter_event_payloads(response.iter_content(chunk_size=None)):
+            if "bytes" not in payload:  # exception frame, e.g. throttled mid-stream
+                raise ArchitectError(f"Stream error: {payload.get('message', payload)}")
+            event = json.loads(base64.b64decode(payload["bytes"]))
+            if event.get("type") == "content_block_delta":
+                text = event.get("delta", {}).get("text", "")
+                parts.append(text)
+                received += len(text)
+                if received >= next_report:
+                    _report(f"Drafting blueprint: {received:,} characters")
+                    next_report = received + STREAM_PROGRESS_CHARS
+            elif event.get("type") == "message_delta":
+                tokens = event.get("usage", {}).get("output_tokens")
+                if tokens:
+                    _report(f"Blueprint drafted: {tokens:,} tokens")
+        return "".join(parts)
 
     def _pre_validate_manifest(self, manifest: GantryManifest) -> tuple[bool, str]:
         """
@@ -1551,6 +1680,7 @@ class Architect:
         prompt: str,
         design_target: str | None = None,
         mission_id: str | None = None,
+        progress: Callable[[str], None] | None = None,
     ) -> GantryManifest:
         """
         Draft Fabrication Instructions from a voice memo.
@@ -1566,6 +1696,8 @@ class Architect:
             prompt: The user's voice memo / build request.
             design_target: Optional famous app to clone (LINKEDIN, TWITTER, etc.)
             mission_id: Optional mission ID to load design reference image from.
+            progress: Optional listener; when given, the model response is
+                streamed and the listener hears how much has been drafted.
 
         Returns:
             A validated GantryManifest ready for the Foundry.
@@ -1637,6 +1769,7 @@ Generate a GantryManifest that replicates this design with 95% accuracy. Include
         # =====================================================================
 
         last_error = None
+        outages = 0  # tiers that failed because Bedrock was down, not on their answer
         tiers_to_try = MODEL_TIERS if ENABLE_MODEL_FALLBACK else [MODEL_TIERS[0]]
 
         for tier_idx, tier in enumerate(tiers_to_try):
@@ -1654,6 +1787,7 @@ Generate a GantryManifest that replicates this design with 95% accuracy. Include
                     system_prompt=system_prompt,
                     user_content=user_content,
                     max_tokens=max_tokens,
+                    progress=progress,
                 )
 
                 console.print("[cyan][ARCHITECT] Response received, parsing...[/cyan]")
@@ -1679,6 +1813,7 @@ Generate a GantryManifest that replicates this design with 95% accuracy. Include
                 return manifest
 
             except requests.RequestException as e:
+                outages += 1
                 last_error = f"Network error with {model_name}: {e}"
                 console.print(f"[yellow][ARCHITECT] {last_error}[/yellow]")
 
@@ -1691,6 +1826,7 @@ Generate a GantryManifest that replicates this design with 95% accuracy. Include
                 console.print(f"[yellow][ARCHITECT] {last_error}[/yellow]")
 
             except ArchitectError as e:
+                outages += isinstance(e, ArchitectUnavailableError)
                 last_error = f"API error with {model_name}: {e}"
                 console.print(f"[yellow][ARCHITECT] {last_error}[/yellow]")
 
@@ -1706,9 +1842,9 @@ Generate a GantryManifest that replicates this design with 95% accuracy. Include
 
         # All tiers failed
         console.print("[red][ARCHITECT] All model tiers exhausted[/red]")
-        raise ArchitectError(
-            f"All {len(tiers_to_try)} model tiers failed. Last error: {last_error}"
-        )
+        # Only an outage on every tier says Bedrock is down; bad answers don't
+        error_cls = ArchitectUnavailableError if outages == len(tiers_to_try) else ArchitectError
+        raise error_cls(f"All {len(tiers_to_try)} model tiers failed. Last error: {last_error}")
 
     def heal_blueprint(self, original_manifest: GantryManifest, error_log: str) -> GantryManifest:
         """
@@ -1770,6 +1906,7 @@ Analyze the error and return a CORRECTED GantryManifest that fixes this issue.""
         # 3-TIER HEALING FALLBACK (same as draft_blueprint)
         # =====================================================================
         last_error = None
+        outages = 0  # tiers that failed because Bedrock was down, not on their answer
         tiers_to_try = MODEL_TIERS if ENABLE_MODEL_FALLBACK else [MODEL_TIERS[0]]
 
         for tier_idx, tier in enumerate(tiers_to_try):
@@ -1808,6 +1945,7 @@ Analyze the error and return a CORRECTED GantryManifest that fixes this issue.""
                     console.print(f"[yellow][ARCHITECT] {last_error}[/yellow]")
 
             except requests.RequestException as e:
+                outages += 1
                 last_error = f"Network error with {model_name}: {e}"
                 console.print(f"[yellow][ARCHITECT] {last_error}[/yellow]")
 
@@ -1820,6 +1958,7 @@ Analyze the error and return a CORRECTED GantryManifest that fixes this issue.""
                 console.print(f"[yellow][ARCHITECT] {last_error}[/yellow]")
 
             except ArchitectError as e:
+                outages += isinstance(e, ArchitectUnavailableError)
                 last_error = f"API error with {model_name}: {e}"
                 console.print(f"[yellow][ARCHITECT] {last_error}[/yellow]")
 
@@ -1835,9 +1974,8 @@ Analyze the error and return a CORRECTED GantryManifest that fixes this issue.""
 
         # All tiers failed
         console.print("[red][ARCHITECT] All healing tiers exhausted[/red]")
-        raise ArchitectError(
-            f"All {len(tiers_to_try)} healing tiers failed. Last error: {last_error}"
-        )
+        error_cls = ArchitectUnavailableError if outages == len(tiers_to_try) else ArchitectError
+        raise error_cls(f"All {len(tiers_to_try)} healing tiers failed. Last error: {last_error}")
 
     def _analyze_error(self, error_log: str) -> dict:
         """
@@ -1920,8 +2058,10 @@ Analyze the error and return a CORRECTED GantryManifest that fixes this issue.""
             ),
             # Assertion failures - check if it's a stub issue
             (
-                lambda e: ("assertionerror" in e or "assert" in e)
-                and ("display" in e or "innerhtml" in e or "textcontent" in e),
+                lambda e: (
+                    ("assertionerror" in e or "assert" in e)
+                    and ("display" in e or "innerhtml" in e or "textcontent" in e)
+                ),
                 {
                     "type": "EMPTY_STUB_ERROR",
                     "cause": "Test function is an empty stub that doesn't modify DOM",
@@ -2054,7 +2194,7 @@ Analyze the error and return a CORRECTED GantryManifest that fixes this issue.""
         }
 
         try:
-            response = requests.post(url, headers=headers, json=body, timeout=30)
+            response = self._session.post(url, headers=headers, json=body, timeout=30)
 
             if response.status_code != 200:
                 console.print(f"[red][ARCHITECT] Consult API error: {response.status_code}[/red]")
@@ -25,9 +25,13 @@
 # "Conversational Co-Pilot" with Visual Intelligence.
 # -----------------------------------------------------------------------------
 
+import hashlib
 import json
 import os
 import re
+import threading
+import time
+from collections import OrderedDict
 
 import requests
 from pydantic import BaseModel
@@ -42,6 +46,11 @@ from src.core.architect import (
 
 console = Console()
 
+# Identical conversations (retries, common first turns) reuse a recent answer
+CACHE_TTL_SECONDS = float(os.getenv("GANTRY_CONSULT_CACHE_TTL", "300"))
+CACHE_MAX_ENTRIES = 512
+CACHE_MIN_CONFIDENCE = 0.5  # errors and unsure answers are always re-asked
+
 # =============================================================================
 # CONSULTANT RESPONSE MODEL
 # =============================================================================
@@ -74,6 +83,9 @@ class ConsultantResponse(BaseModel):
     iterations: list[IterationPlan] = []  # Full breakdown (if complex)
     total_iterations: int = 1  # How many iterations needed
     current_iteration: int = 1  # Which iteration we're building now
+    # Final spec, resolved over the whole conversation when READY_TO_BUILD is
+    # decided locally (design_target then holds the conversation-wide target)
+    build_prompt: str | None = None
 
 
 # =============================================================================
@@ -226,6 +238,12 @@ User: "[LONG PROJECT SPEC with authentication, payments, admin panel, etc.]"
 """
 
 
+def _conversation_key(conversation: list[dict]) -> str:
+    """Stable digest of a conversation, independent of dict key order."""
+    encoded = json.dumps(conversation, sort_keys=True, separators=(",", ":")).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
 class Consultant:
     """
     The AI Architect Agent that manages the consultation loop.
@@ -242,8 +260,39 @@ class Consultant:
         if not self._api_key:
             raise ArchitectError("BEDROCK_API_KEY not set")
 
+        # key -> (expires_at, response), least recently used first
+        self._cache: OrderedDict[str, tuple[float, ConsultantResponse]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+
         console.print("[green][AI-ARCHITECT] Agent online[/green]")
 
+    def _cache_get(self, key: str) -> ConsultantResponse | None:
+        """Return a copy of a live cached response, or None."""
+        if CACHE_TTL_SECONDS <= 0:
+            return None
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+            return entry[1].model_copy(deep=True)
+
+    def _cache_put(self, key: str, response: ConsultantResponse) -> None:
+        """Remember a response, evicting the least recently used past the cap."""
+        if CACHE_TTL_SECONDS <= 0:
+            return
+        with self._cache_lock:
+            self._cache[key] = (
+                time.monotonic() + CACHE_TTL_SECONDS,
+                response.model_copy(deep=True),
+            )
+            self._cache.move_to_end(key)
+            while len(self._cache) > CACHE_MAX_ENTRIES:
+                self._cache.popitem(last=False)
+
     def _clean_json(self, text: str) -> str:
         """Extract valid JSON from response."""
         first_brace = text.find("{")
@@ -308,24 +357,33 @@ class Consultant:
         if is_confirmation and len(conversation) > 1:
             console.print("[green][AI-ARCHITECT] User confirmed. Ready to build.[/green]")
 
-            # Extract design target from conversation history
-            for msg in conversation:
-                content = msg.get("content", "")
-                target = detect_design_target(content)
-                if target:
-                    detected_target = target
-                    break
-
+            # Resolve the build spec now so the caller needn't rescan the history
             return ConsultantResponse(
                 status="READY_TO_BUILD",
                 question=None,
                 proposed_stack="next.js",
-                design_target=detected_target,
+                design_target=self.get_design_target(conversation),
                 speech="Copy. Building now.",
                 features=[],
                 confidence=1.0,
+                build_prompt=self.get_build_prompt(conversation),
             )
 
+        key = _conversation_key(conversation)
+        cached = self._cache_get(key)
+        if cached is not None:
+            console.print("[cyan][AI-ARCHITECT] Reusing recent analysis[/cyan]")
+            return cached
+
+        response = self._call_bedrock(conversation, detected_target)
+        if response.confidence >= CACHE_MIN_CONFIDENCE:
+            self._cache_put(key, response)
+        return response
+
+    def _call_bedrock(
+        self, conversation: list[dict], detected_target: str | None
+    ) -> ConsultantResponse:
+        """Ask the model for the next step (one Bedrock round-trip, with retries)."""
         # Call Bedrock for analysis
         url = f"{self._endpoint}/model/{CLAUDE_MODEL_ID}/invoke"
 
@@ -349,8 +407,6 @@ class Consultant:
         for attempt in range(max_retries):
             try:
                 if attempt > 0:
-                    import time
-
                     wait_time = 2**attempt  # 2s, 4s
                     console.print(
                         f"[yellow][AI-ARCHITECT] Retry {attempt}/{max_retries} in {wait_time}s...[/yellow]"
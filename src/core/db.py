@@ -24,18 +24,26 @@
 # - Supports distributed setups if needed
 # -----------------------------------------------------------------------------
 
+import copy
 import os
+import threading
+import time
 import uuid
+from collections.abc import Callable
 from contextlib import contextmanager
+from functools import wraps
+from typing import TypeVar
 
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import RealDictCursor, execute_values
 from psycopg2.pool import SimpleConnectionPool
 from pydantic import BaseModel
 from rich.console import Console
 
 console = Console()
 
+T = TypeVar("T")
+
 # Database configuration from environment
 DB_CONFIG = {
     "host": os.getenv("DB_HOST", "localhost"),
@@ -48,6 +56,15 @@ DB_CONFIG = {
     "options": "-c statement_timeout=30000",  # 30s query timeout (in ms)
 }
 
+# Rows per statement for batched status writes
+BATCH_PAGE_SIZE = 256
+
+# Mission reads behind status polling are served from a short-lived cache
+# (0 disables it). Local writes invalidate it; other processes' writes show
+# up within the TTL.
+READ_CACHE_TTL_SECONDS = float(os.getenv("GANTRY_READ_CACHE_TTL", "2.0"))
+READ_CACHE_MAX_ENTRIES = 512
+
 # Connection pool (initialized on first use)
 _pool: SimpleConnectionPool | None = None
 
@@ -82,6 +99,9 @@ class MissionRecord(BaseModel):
     # Iteration Support
     parent_mission_id: str | None = None
     iteration_number: int = 1
+    # Final outcome links (set by finalize_mission)
+    deploy_url: str | None = None
+    pr_url: str | None = None
 
 
 def _get_pool() -> SimpleConnectionPool:
@@ -139,6 +159,78 @@ def get_connection():
         pool.putconn(conn)
 
 
+# =============================================================================
+# READ CACHE
+# =============================================================================
+
+_read_cache: dict[tuple, tuple[float, object]] = {}
+_read_cache_lock = threading.Lock()
+_read_cache_generation = 0
+
+
+def invalidate_read_cache() -> None:
+    """Drop every cached mission read (called after any local write)."""
+    global _read_cache_generation
+    with _read_cache_lock:
+        _read_cache.clear()
+        _read_cache_generation += 1
+
+
+def _cached_read(func: Callable[..., T]) -> Callable[..., T]:
+    """Serve repeat calls with the same arguments from the TTL cache."""
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if READ_CACHE_TTL_SECONDS <= 0:
+            return func(*args, **kwargs)
+        key = (
+            func.__name__,
+            tuple(_hashable(a) for a in args),
+            tuple(sorted((k, _hashable(v)) for k, v in kwargs.items())),
+        )
+        now = time.monotonic()
+        with _read_cache_lock:
+            hit = _read_cache.get(key)
+            generation = _read_cache_generation
+        if hit is not None and hit[0] > now:
+            # Callers may mutate records (e.g. append a conversation turn); never
+            # hand out the cached object itself
+            return copy.deepcopy(hit[1])
+
+        value = func(*args, **kwargs)
+        with _read_cache_lock:
+            # A write that landed mid-query may not be in value; don't cache it
+            if generation == _read_cache_generation:
+                if len(_read_cache) >= READ_CACHE_MAX_ENTRIES:
+                    _read_cache.clear()
+                _read_cache[key] = (now + READ_CACHE_TTL_SECONDS, copy.deepcopy(value))
+        return value
+
+    return wrapper
+
+
+def _hashable(arg: object) -> object:
+    """Turn list/set arguments into hashable cache-key parts."""
+    if isinstance(arg, list):
+        return tuple(arg)
+    if isinstance(arg, set):
+        return frozenset(arg)
+    return arg
+
+
+def _invalidates_reads(func: Callable[..., T]) -> Callable[..., T]:
+    """Invalidate the read cache once the wrapped write has run."""
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        finally:
+            invalidate_read_cache()
+
+    return wrapper
+
+
 def init_db() -> None:
     """
     Initialize the missions database table.
@@ -184,6 +276,8 @@ def init_db() -> None:
             ("proposed_stack", "VARCHAR(50)"),
             ("parent_mission_id", "UUID REFERENCES missions(id)"),
             ("iteration_number", "INTEGER DEFAULT 1"),
+            ("deploy_url", "TEXT"),
+            ("pr_url", "TEXT"),
         ]:
             try:
                 cursor.execute(f"ALTER TABLE missions ADD COLUMN IF NOT EXISTS {column} {col_type}")
@@ -193,6 +287,7 @@ def init_db() -> None:
     console.print(f"[green][DB] Database initialized: {DB_CONFIG['database']}[/green]")
 
 
+@_invalidates_reads
 def create_mission(prompt: str, parent_mission_id: str | None = None) -> str:
     """
     Create a new mission record.
@@ -251,6 +346,7 @@ def get_iteration_count(mission_id: str) -> int:
         return result[0] if result else 1
 
 
+@_invalidates_reads
 def update_mission_status(mission_id: str, status: str, speech: str | None = None) -> None:
     """
     Update the status and speech output of a mission.
@@ -273,6 +369,94 @@ def update_mission_status(mission_id: str, status: str, speech: str | None = Non
     console.print(f"[cyan][DB] Mission {mission_id[:8]} -> {status}[/cyan]")
 
 
+@_invalidates_reads
+def update_mission_statuses(rows: list[tuple[str, str, str | None]]) -> None:
+    """
+    Update the status and speech output of many missions in one statement.
+
+    Uses a single UPDATE ... FROM (VALUES ...) so a batch costs one round trip
+    (cursor.executemany would issue one UPDATE per row).
+
+    Args:
+        rows: (mission_id, status, speech) tuples.
+    """
+    if not rows:
+        return
+
+    with get_connection() as conn, conn.cursor() as cursor:
+        execute_values(
+            cursor,
+            """
+                UPDATE missions AS m
+                SET status = v.status, speech_output = v.speech,
+                    updated_at = CURRENT_TIMESTAMP
+                FROM (VALUES %s) AS v(id, status, speech)
+                WHERE m.id = v.id
+                """,
+            rows,
+            template="(%s::uuid, %s, %s)",
+            page_size=BATCH_PAGE_SIZE,
+        )
+
+    console.print(f"[cyan][DB] Batched status update: {len(rows)} mission(s)[/cyan]")
+
+
+@_invalidates_reads
+def finalize_mission(
+    mission_id: str,
+    *,
+    status: str,
+    speech: str,
+    deploy_url: str | None = None,
+    pr_url: str | None = None,
+) -> None:
+    """
+    Write a mission's final status and outcome links in one transaction.
+
+    Args:
+        mission_id: The UUID of the mission.
+        status: Final status (DEPLOYED, PR_OPENED, SUCCESS).
+        speech: Speech output for TTS.
+        deploy_url: Live deployment URL, if any.
+        pr_url: Pull Request URL, if any.
+    """
+    with get_connection() as conn, conn.cursor() as cursor:
+        cursor.execute(
+            """
+                UPDATE missions
+                SET status = %s, speech_output = %s, deploy_url = %s, pr_url = %s,
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE id = %s
+                """,
+            (status, speech, deploy_url, pr_url, mission_id),
+        )
+
+    console.print(f"[cyan][DB] Mission {mission_id[:8]} -> {status} (final)[/cyan]")
+
+
+def _row_to_record(row: dict) -> MissionRecord:
+    """Map a missions row (SELECT *) to a MissionRecord."""
+    return MissionRecord(
+        id=str(row["id"]),
+        prompt=row["prompt"],
+        status=row["status"],
+        speech_output=row["speech_output"],
+        created_at=row["created_at"].isoformat(),  # NOT NULL column
+        updated_at=row["updated_at"].isoformat() if row["updated_at"] else None,
+        # Consultation fields
+        conversation_history=row.get("conversation_history") or [],
+        design_target=row.get("design_target"),
+        pending_question=row.get("pending_question"),
+        proposed_stack=row.get("proposed_stack"),
+        # Iteration fields
+        parent_mission_id=str(row["parent_mission_id"]) if row.get("parent_mission_id") else None,
+        iteration_number=row.get("iteration_number") or 1,
+        deploy_url=row.get("deploy_url"),
+        pr_url=row.get("pr_url"),
+    )
+
+
+@_cached_read
 def get_mission(mission_id: str) -> MissionRecord | None:
     """
     Retrieve a mission by ID.
@@ -290,26 +474,10 @@ def get_mission(mission_id: str) -> MissionRecord | None:
         if row is None:
             return None
 
-        return MissionRecord(
-            id=str(row["id"]),
-            prompt=row["prompt"],
-            status=row["status"],
-            speech_output=row["speech_output"],
-            created_at=row["created_at"].isoformat() if row["created_at"] else None,
-            updated_at=row["updated_at"].isoformat() if row["updated_at"] else None,
-            # Consultation fields
-            conversation_history=row.get("conversation_history") or [],
-            design_target=row.get("design_target"),
-            pending_question=row.get("pending_question"),
-            proposed_stack=row.get("proposed_stack"),
-            # Iteration fields
-            parent_mission_id=str(row["parent_mission_id"])
-            if row.get("parent_mission_id")
-            else None,
-            iteration_number=row.get("iteration_number") or 1,
-        )
+        return _row_to_record(row)
 
 
+@_cached_read
 def list_missions(limit: int = 50) -> list[MissionRecord]:
     """
     List recent missions.
@@ -331,29 +499,10 @@ def list_missions(limit: int = 50) -> list[MissionRecord]:
         )
         rows = cursor.fetchall()
 
-        return [
-            MissionRecord(
-                id=str(row["id"]),
-                prompt=row["prompt"],
-                status=row["status"],
-                speech_output=row["speech_output"],
-                created_at=row["created_at"].isoformat() if row["created_at"] else None,
-                updated_at=row["updated_at"].isoformat() if row["updated_at"] else None,
-                # Consultation fields
-                conversation_history=row.get("conversation_history") or [],
-                design_target=row.get("design_target"),
-                pending_question=row.get("pending_question"),
-                proposed_stack=row.get("proposed_stack"),
-                # Iteration fields
-                parent_mission_id=str(row["parent_mission_id"])
-                if row.get("parent_mission_id")
-                else None,
-                iteration_number=row.get("iteration_number") or 1,
-            )
-            for row in rows
-        ]
+        return [_row_to_record(row) for row in rows]
 
 
+@_cached_read
 def search_missions(keywords: list[str], limit: int = 5) -> list[MissionRecord]:
     """
     Search for missions containing any of the keywords.
@@ -387,19 +536,10 @@ def search_missions(keywords: list[str], limit: int = 5) -> list[MissionRecord]:
         )
         rows = cursor.fetchall()
 
-        return [
-            MissionRecord(
-                id=str(row["id"]),
-                prompt=row["prompt"],
-                status=row["status"],
-                speech_output=row["speech_output"],
-                created_at=row["created_at"].isoformat() if row["created_at"] else None,
-                updated_at=row["updated_at"].isoformat() if row["updated_at"] else None,
-            )
-            for row in rows
-        ]
+        return [_row_to_record(row) for row in rows]
 
 
+@_cached_read
 def find_missions_by_prompt_hint(hint: str, limit: int = 10) -> list[MissionRecord]:
     """
     Find missions whose prompt matches the hint (any status).
@@ -428,21 +568,40 @@ def find_missions_by_prompt_hint(hint: str, limit: int = 10) -> list[MissionReco
         )
         rows = cursor.fetchall()
 
-        return [
-            MissionRecord(
-                id=str(row["id"]),
-                prompt=row["prompt"],
-                status=row["status"],
-                speech_output=row["speech_output"],
-                created_at=row["created_at"].isoformat() if row["created_at"] else None,
-                updated_at=row["updated_at"].isoformat() if row["updated_at"] else None,
-                conversation_history=row.get("conversation_history") or [],
-                design_target=row.get("design_target"),
-                pending_question=row.get("pending_question"),
-                proposed_stack=row.get("proposed_stack"),
-            )
-            for row in rows
-        ]
+        return [_row_to_record(row) for row in rows]
+
+
+@_cached_read
+def find_missions_by_status(statuses: frozenset[str], limit: int = 5) -> list[MissionRecord]:
+    """
+    Find the most recent missions currently in any of the given statuses.
+
+    Used for status queries: the filter runs in SQL (idx_missions_status), so
+    an active build is found even when newer finished missions outnumber it.
+
+    Args:
+        statuses: Statuses to match (e.g. the in-progress set).
+        limit: Maximum number of missions to return.
+
+    Returns:
+        List of MissionRecord objects, most recent first.
+    """
+    if not statuses:
+        return []
+
+    with get_connection() as conn, conn.cursor(cursor_factory=RealDictCursor) as cursor:
+        cursor.execute(
+            """
+                SELECT * FROM missions
+                WHERE status = ANY(%s)
+                ORDER BY created_at DESC
+                LIMIT %s
+                """,
+            (sorted(statuses), limit),
+        )
+        rows = cursor.fetchall()
+
+        return [_row_to_record(row) for row in rows]
 
 
 def get_mission_by_name(project_name: str) -> MissionRecord | None:
@@ -470,16 +629,10 @@ def get_mission_by_name(project_name: str) -> MissionRecord | None:
         if not row:
             return None
 
-        return MissionRecord(
-            id=str(row["id"]),
-            prompt=row["prompt"],
-            status=row["status"],
-            speech_output=row["speech_output"],
-            created_at=row["created_at"].isoformat() if row["created_at"] else None,
-            updated_at=row["updated_at"].isoformat() if row["updated_at"] else None,
-        )
+        return _row_to_record(row)
 
 
+@_invalidates_reads
 def clear_all_missions() -> int:
     """
     Delete all missions from the database (clear projects list).
@@ -498,6 +651,7 @@ def clear_all_missions() -> int:
     return count
 
 
+@_invalidates_reads
 def delete_mission(mission_id: str) -> bool:
     """
     Delete a specific mission from the database.
@@ -537,6 +691,7 @@ def close_pool() -> None:
 # =============================================================================
 
 
+@_invalidates_reads
 def create_consultation(prompt: str, design_target: str | None = None) -> str:
     """
     Create a new consultation session.
@@ -568,6 +723,7 @@ def create_consultation(prompt: str, design_target: str | None = None) -> str:
     return mission_id
 
 
+@_invalidates_reads
 def append_to_conversation(mission_id: str, role: str, content: str) -> None:
     """
     Append a message to the conversation history.
@@ -579,28 +735,24 @@ def append_to_conversation(mission_id: str, role: str, content: str) -> None:
     """
     import json
 
-    with get_connection() as conn, conn.cursor() as cursor:
-        # Fetch current history
-        cursor.execute("SELECT conversation_history FROM missions WHERE id = %s", (mission_id,))
-        row = cursor.fetchone()
-        history = row[0] if row and row[0] else []
+    message = json.dumps([{"role": role, "content": content}])
 
-        # Append new message
-        history.append({"role": role, "content": content})
-
-        # Update
+    # JSONB append in SQL: one statement, no read-modify-write race between turns
+    with get_connection() as conn, conn.cursor() as cursor:
         cursor.execute(
             """
-            UPDATE missions 
-            SET conversation_history = %s, updated_at = CURRENT_TIMESTAMP
+            UPDATE missions
+            SET conversation_history = COALESCE(conversation_history, '[]'::jsonb) || %s::jsonb,
+                updated_at = CURRENT_TIMESTAMP
             WHERE id = %s
             """,
-            (json.dumps(history), mission_id),
+            (message, mission_id),
         )
 
     console.print(f"[dim][DB] Conversation updated: {mission_id[:8]} (+{role})[/dim]")
 
 
+@_invalidates_reads
 def set_pending_question(mission_id: str, question: str, proposed_stack: str | None = None) -> None:
     """
     Set a pending question that Gantry is waiting for the user to answer.
@@ -624,6 +776,7 @@ def set_pending_question(mission_id: str, question: str, proposed_stack: str | N
     console.print(f"[yellow][DB] Awaiting input: {mission_id[:8]}[/yellow]")
 
 
+@_invalidates_reads
 def clear_pending_question(mission_id: str) -> None:
     """
     Clear the pending question after user responds.
@@ -642,6 +795,7 @@ def clear_pending_question(mission_id: str) -> None:
         )
 
 
+@_invalidates_reads
 def set_design_target(mission_id: str, design_target: str) -> None:
     """
     Set the design target (famous app to clone).
@@ -663,6 +817,101 @@ def set_design_target(mission_id: str, design_target: str) -> None:
     console.print(f"[cyan][DB] Design target set: {design_target}[/cyan]")
 
 
+@_invalidates_reads
+def commit_consultant_turn(
+    mission_id: str,
+    speech: str,
+    next_status: str | None = None,
+    question: str | None = None,
+    proposed_stack: str | None = None,
+) -> None:
+    """
+    Record one consultant turn in a single statement (one transaction).
+
+    Appends the assistant message to the conversation history and applies the
+    resulting state change, replacing separate append_to_conversation +
+    mark_ready_to_build / set_pending_question round-trips.
+
+    Args:
+        mission_id: The mission/consultation ID.
+        speech: The assistant's reply to append to the conversation.
+        next_status: READY_TO_BUILD, AWAITING_INPUT, or None (append only).
+        question: Pending question to store (AWAITING_INPUT only).
+        proposed_stack: Optional proposed tech stack (AWAITING_INPUT only).
+    """
+    import json
+
+    message = json.dumps([{"role": "assistant", "content": speech}])
+
+    with get_connection() as conn, conn.cursor() as cursor:
+        if next_status == "READY_TO_BUILD":
+            cursor.execute(
+                """
+                UPDATE missions
+                SET conversation_history = COALESCE(conversation_history, '[]'::jsonb) || %s::jsonb,
+                    status = 'READY_TO_BUILD', pending_question = NULL,
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE id = %s
+                """,
+                (message, mission_id),
+            )
+        elif next_status == "AWAITING_INPUT":
+            cursor.execute(
+                """
+                UPDATE missions
+                SET conversation_history = COALESCE(conversation_history, '[]'::jsonb) || %s::jsonb,
+                    pending_question = %s, proposed_stack = %s,
+                    status = 'AWAITING_INPUT', updated_at = CURRENT_TIMESTAMP
+                WHERE id = %s
+                """,
+                (message, question, proposed_stack, mission_id),
+            )
+        else:
+            cursor.execute(
+                """
+                UPDATE missions
+                SET conversation_history = COALESCE(conversation_history, '[]'::jsonb) || %s::jsonb,
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE id = %s
+                """,
+                (message, mission_id),
+            )
+
+    console.print(
+        f"[dim][DB] Consultant turn saved: {mission_id[:8]} (-> {next_status or 'unchanged'})[/dim]"
+    )
+
+
+@_invalidates_reads
+def commit_user_turn(mission_id: str, content: str) -> None:
+    """
+    Record the user's reply in a single statement (one transaction).
+
+    Appends the user message and clears the pending question it answers,
+    replacing separate clear_pending_question + append_to_conversation calls.
+
+    Args:
+        mission_id: The mission/consultation ID.
+        content: The user's message.
+    """
+    import json
+
+    message = json.dumps([{"role": "user", "content": content}])
+
+    with get_connection() as conn, conn.cursor() as cursor:
+        cursor.execute(
+            """
+            UPDATE missions
+            SET conversation_history = COALESCE(conversation_history, '[]'::jsonb) || %s::jsonb,
+                pending_question = NULL, updated_at = CURRENT_TIMESTAMP
+            WHERE id = %s
+            """,
+            (message, mission_id),
+        )
+
+    console.print(f"[dim][DB] User turn saved: {mission_id[:8]}[/dim]")
+
+
 def get_active_consultation(limit: int = 1) -> MissionRecord | None:
     """
     Get the most recent active consultation (CONSULTING or AWAITING_INPUT).
@@ -690,20 +939,10 @@ def get_active_consultation(limit: int = 1) -> MissionRecord | None:
         if not row:
             return None
 
-        return MissionRecord(
-            id=str(row["id"]),
-            prompt=row["prompt"],
-            status=row["status"],
-            speech_output=row["speech_output"],
-            created_at=row["created_at"].isoformat() if row["created_at"] else None,
-            updated_at=row["updated_at"].isoformat() if row["updated_at"] else None,
-            conversation_history=row.get("conversation_history") or [],
-            design_target=row.get("design_target"),
-            pending_question=row.get("pending_question"),
-            proposed_stack=row.get("proposed_stack"),
-        )
+        return _row_to_record(row)
 
 
+@_invalidates_reads
 def mark_ready_to_build(mission_id: str) -> None:
     """
     Mark consultation as ready to build.
@@ -778,22 +1017,4 @@ def get_mission_children(parent_id: str) -> list[MissionRecord]:
         )
         rows = cursor.fetchall()
 
-        return [
-            MissionRecord(
-                id=str(row["id"]),
-                prompt=row["prompt"],
-                status=row["status"],
-                speech_output=row["speech_output"],
-                created_at=row["created_at"].isoformat() if row["created_at"] else None,
-                updated_at=row["updated_at"].isoformat() if row["updated_at"] else None,
-                conversation_history=row.get("conversation_history") or [],
-                design_target=row.get("design_target"),
-                pending_question=row.get("pending_question"),
-                proposed_stack=row.get("proposed_stack"),
-                parent_mission_id=str(row["parent_mission_id"])
-                if row.get("parent_mission_id")
-                else None,
-                iteration_number=row.get("iteration_number") or 1,
-            )
-            for row in rows
-        ]
+        return [_row_to_record(row) for row in rows]
@@ -0,0 +1,125 @@
+# Copyright 2026 Pramod Kumar Voola
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# -----------------------------------------------------------------------------
+# THE SCRIBE - BATCHED STATUS WRITER
+# -----------------------------------------------------------------------------
+# Responsibility: Take in-progress mission status writes off the hot path.
+#
+# Callers enqueue (mission_id, status, speech) rows; one daemon thread drains
+# the queue every GANTRY_DB_BATCH_MS (or GANTRY_DB_BATCH_SIZE rows), keeps
+# only the latest row per mission, and commits the batch in one transaction.
+#
+# Final states must be visible as soon as the caller returns, so callers
+# flush() before writing them synchronously.
+# -----------------------------------------------------------------------------
+
+import os
+import queue
+import threading
+import time
+
+from rich.console import Console
+
+from src.core.db import update_mission_statuses
+
+console = Console()
+
+BATCH_MS = int(os.getenv("GANTRY_DB_BATCH_MS", "100"))
+BATCH_SIZE = int(os.getenv("GANTRY_DB_BATCH_SIZE", "256"))
+
+# Items are status rows or a threading.Event flush marker
+_queue: "queue.Queue[tuple[str, str, str | None] | threading.Event]" = queue.Queue()
+_writer_thread: threading.Thread | None = None
+_start_lock = threading.Lock()
+
+
+def _writer_loop() -> None:
+    """Drain the queue into coalesced, single-transaction batches forever."""
+    while True:
+        item = _queue.get()
+        pending: dict[str, tuple[str, str, str | None]] = {}
+        waiters: list[threading.Event] = []
+        window_end = time.monotonic() + BATCH_MS / 1000
+
+        while True:
+            if isinstance(item, threading.Event):
+                # Flush marker: write what we have now
+                waiters.append(item)
+                break
+            # Last write wins; re-insert so dict order follows the latest update
+            pending.pop(item[0], None)
+            pending[item[0]] = item
+            if len(pending) >= BATCH_SIZE:
+                break
+            remaining = window_end - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = _queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+
+        if pending:
+            try:
+                update_mission_statuses(list(pending.values()))
+            except Exception as e:
+                console.print(f"[red][DB] Batched status write failed: {e}[/red]")
+
+        for waiter in waiters:
+            waiter.set()
+
+
+def _ensure_writer() -> None:
+    """Start the writer thread on first use."""
+    global _writer_thread
+    if _writer_thread is not None and _writer_thread.is_alive():
+        return
+    with _start_lock:
+        if _writer_thread is None or not _writer_thread.is_alive():
+            _writer_thread = threading.Thread(
+                target=_writer_loop, name="gantry-db-writer", daemon=True
+            )
+            _writer_thread.start()
+
+
+def enqueue_mission_status(mission_id: str, status: str, speech: str | None = None) -> None:
+    """
+    Queue a status update for the next batch (returns immediately).
+
+    Args:
+        mission_id: The UUID of the mission.
+        status: New status.
+        speech: Optional speech output for TTS.
+    """
+    _ensure_writer()
+    _queue.put((mission_id, status, speech))
+
+
+def flush(timeout: float | None = 5.0) -> bool:
+    """
+    Block until every update queued before this call has been written.
+
+    Args:
+        timeout: Maximum seconds to wait (None waits forever).
+
+    Returns:
+        True if the flush completed, False on timeout.
+    """
+    if _writer_thread is None and _queue.empty():
+        return True
+    _ensure_writer()
+    done = threading.Event()
+    _queue.put(done)
+    return done.wait(timeout)
@@ -29,39 +29,51 @@
 # -----------------------------------------------------------------------------
 
 import asyncio
-import base64
-import json
 import os
+import random
 import re
 import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING
+from functools import cached_property
+from pathlib import Path
+from typing import TYPE_CHECKING, ClassVar, cast
 
 from rich.console import Console
 
-from src.core.architect import Architect, ArchitectError, detect_design_target
+from src.core.architect import (
+    Architect,
+    ArchitectError,
+    ArchitectUnavailableError,
+    detect_design_target,
+)
 from src.core.consultant import Consultant, ConsultantResponse
 from src.core.db import (
-    append_to_conversation,
     clear_all_missions,
-    clear_pending_question,
+    commit_consultant_turn,
+    commit_user_turn,
     create_consultation,
     create_mission,
+    finalize_mission,
     find_missions_by_prompt_hint,
+    find_missions_by_status,
     get_active_consultation,
     get_mission,
     init_db,
     list_missions,
-    mark_ready_to_build,
     search_missions,
     set_design_target,
-    set_pending_question,
     update_mission_status,
 )
+from src.core.db_writer import enqueue_mission_status
+from src.core.db_writer import flush as flush_mission_statuses
 from src.core.deployer import DeploymentError
 from src.core.foundry import MISSIONS_DIR, AuditFailedError, BuildTimeoutError, Foundry
 from src.core.policy import PolicyGate, SecurityViolation
 from src.core.publisher import Publisher, PublishError, SecurityBlock
+from src.core.reliability import CircuitBreaker, CircuitOpenError
 from src.domain.models import GantryManifest
 
 if TYPE_CHECKING:
@@ -75,9 +87,22 @@ console = Console()
 
 MAX_RETRIES = 3
 SKIP_PUBLISH = os.getenv("GANTRY_SKIP_PUBLISH", "").lower() == "true"
-MAX_CONCURRENT_MISSIONS = 3
+# Drop routine per-mission console lines (each costs a Rich render on the loop)
+QUIET = os.getenv("GANTRY_QUIET", "").lower() == "true"
+MAX_CONCURRENT_MISSIONS = int(os.getenv("GANTRY_MAX_CONCURRENT", "3"))
 MISSION_TIMEOUT_SECONDS = 600  # 10 minutes
+# On shutdown, let running missions finish for this long before cancelling them
+SHUTDOWN_GRACE_SECONDS = float(os.getenv("GANTRY_SHUTDOWN_GRACE", "30"))
+# Don't start a build attempt with less budget than this left; it can't finish in time
+MIN_BUILD_BUDGET_SEC = int(os.getenv("GANTRY_MIN_BUILD_BUDGET", "30"))
 PROGRESS_UPDATE_SECONDS = 5
+# Status broadcasts within this window collapse to the latest one per mission
+BROADCAST_COALESCE_SECONDS = 0.02
+# Architect/build step frames waiting for WebSocket delivery; extra steps are dropped
+PROGRESS_STEP_QUEUE_SIZE = 64
+# Full-jitter backoff between heal retries: uniform(0, min(MAX, BASE * 2^(attempt-1)))
+HEAL_BACKOFF_BASE_SECONDS = 2.0
+HEAL_BACKOFF_MAX_SECONDS = 30.0
 DESIGN_REFERENCE_NAME = "design-reference"
 
 # Status labels for TTS
@@ -99,6 +124,7 @@ STATUS_STAGE_LABELS = {
     "FAILED": "Failed",
     "TIMEOUT": "Timed out",
     "PUBLISH_FAILED": "Publish failed",
+    "UPSTREAM_DOWN": "Upstream service unavailable",
 }
 
 IN_PROGRESS_STATUSES = frozenset(
@@ -114,115 +140,287 @@ IN_PROGRESS_STATUSES = frozenset(
     }
 )
 
+# Final states: a mission never leaves these on its own, so pollers can stop
+TERMINAL_STATUSES = frozenset(
+    {
+        "SUCCESS",
+        "DEPLOYED",
+        "PR_OPENED",
+        "FAILED",
+        "BLOCKED",
+        "TIMEOUT",
+        "CRITICAL_FAILURE",
+        "UPSTREAM_DOWN",
+    }
+)
+
+# Failed states retry_failed_mission may restart
+RETRYABLE_STATUSES = frozenset({"FAILED", "BLOCKED", "TIMEOUT", "PUBLISH_FAILED", "UPSTREAM_DOWN"})
+
+
+# Build failures self-healing can act on: exception type -> (label, heal context builder).
+# Anything not listed (timeouts, open circuits, ...) propagates out of the build loop.
+ERROR_POLICY: dict[type[Exception], tuple[str, Callable[[Exception], str]]] = {
+    AuditFailedError: ("Audit", lambda e: cast("AuditFailedError", e).output),
+    DeploymentError: ("Deploy", lambda e: f"Deployment failed: {e}"),
+}
+# Deploy failures no code change can fix (credentials, billing); retrying them only
+# spends the mission budget on more Architect and Foundry runs
+_UNHEALABLE_DEPLOY_RE = re.compile(
+    r"VERCEL_TOKEN not configured|unauthori[sz]ed|forbidden|invalid token"
+    r"|\b40[123]\b|quota|payment required|billing",
+    re.IGNORECASE,
+)
+
+# Mission-ending failures: exception type -> (final status, speech builder).
+# Anything not listed ends the mission as FAILED with the error text.
+MISSION_FAILURES: dict[type[Exception], tuple[str, Callable[[Exception], str]]] = {
+    BuildTimeoutError: ("TIMEOUT", lambda _: "Mission timeout exceeded."),
+    CircuitOpenError: ("UPSTREAM_DOWN", lambda e: f"{e}. Try again in a minute."),
+    SecurityViolation: ("BLOCKED", lambda _: "Policy violation."),
+}
+_UNEXPECTED_FAILURE: tuple[str, Callable[[Exception], str]] = (
+    "FAILED",
+    lambda e: f"Error: {str(e)[:100]}",
+)
+
+
+# Architect error substring -> user-facing explanation. Order matters: the first
+# listed pattern found anywhere wins (e.g. "timeout" beats "connection").
+_FRIENDLY_ERRORS: tuple[tuple[str, str], ...] = (
+    (
+        "api error 400",
+        "AI model unavailable. The model may not be enabled in your AWS region.",
+    ),
+    ("api error 401", "Authentication failed. Please check your AWS credentials."),
+    ("unauthorized", "Authentication failed. Please check your AWS credentials."),
+    ("api error 403", "Access denied. You may not have permission to use this AI model."),
+    ("forbidden", "Access denied. You may not have permission to use this AI model."),
+    ("api error 429", "Rate limited. Too many requests - please wait and try again."),
+    ("rate limit", "Rate limited. Too many requests - please wait and try again."),
+    (
+        "api error 5",
+        "AI service temporarily unavailable. Please try again in a few minutes.",
+    ),
+    (
+        "server error",
+        "AI service temporarily unavailable. Please try again in a few minutes.",
+    ),
+    ("timeout", "Request timed out. The AI took too long to respond."),
+    ("no valid json", "AI response was malformed. Please try again."),
+    ("api_key", "API key not configured. Please set BEDROCK_API_KEY."),
+    ("bedrock_api_key", "API key not configured. Please set BEDROCK_API_KEY."),
+    ("connection", "Network error. Please check your internet connection."),
+    ("network", "Network error. Please check your internet connection."),
+)
+
+
+# Phrases in an Architect refusal that mean "won't copy a brand" (any one is enough)
+_TRADEMARK_REFUSAL_RE = re.compile(
+    r"copyright|trademark|brand|cannot create|cannot generate|proprietary"
+    r"|intellectual property|unable to replicate|cannot replicate|clone"
+)
+# Brands we suggest "-inspired" rewrites for; the first listed one in the prompt is named
+_BRAND_NAMES = (
+    "tesla",
+    "apple",
+    "google",
+    "microsoft",
+    "amazon",
+    "meta",
+    "facebook",
+    "twitter",
+    "netflix",
+    "spotify",
+    "airbnb",
+    "uber",
+    "linkedin",
+    "instagram",
+)
+
 
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
 
 
+def _classify(
+    error: Exception,
+    table: dict[type[Exception], tuple[str, Callable[[Exception], str]]] = ERROR_POLICY,
+) -> tuple[str, Callable[[Exception], str]] | None:
+    """Look up an error's entry in a policy table (walks the MRO so subclasses match)."""
+    for cls in type(error).__mro__:
+        policy = table.get(cls)
+        if policy is not None:
+            return policy
+    return None
+
+
+def _is_healable(error: Exception, error_log: str) -> bool:
+    """False for deploy failures caused by credentials or billing, which healing can't fix."""
+    return not (isinstance(error, DeploymentError) and _UNHEALABLE_DEPLOY_RE.search(error_log))
+
+
+def _info(message: str) -> None:
+    """Print a routine progress line unless GANTRY_QUIET is set (problems always print)."""
+    if not QUIET:
+        console.print(message)
+
+
+def _write_after_flush(write: Callable[[], None]) -> None:
+    """
+    Flush queued progress rows, then run a resting-state write.
+
+    Blocking: callers on the event loop run it in the default executor. The
+    flush guarantees no older batched row can land on top of the write.
+    """
+    flush_mission_statuses()
+    write()
+
+
+# Base64 characters decoded per write (multiple of 4, so chunks split cleanly)
+_B64_CHUNK_CHARS = 64 * 1024
+
+
+def _write_base64_file(path: Path, encoded: str) -> None:
+    """Decode base64 text into path chunk by chunk, never holding the whole image."""
+    import base64
+
+    carry = ""
+    with open(path, "wb") as f:
+        for i in range(0, len(encoded), _B64_CHUNK_CHARS):
+            # Drop line breaks first so every decoded piece stays 4-char aligned
+            chunk = carry + "".join(encoded[i : i + _B64_CHUNK_CHARS].split())
+            cut = len(chunk) - len(chunk) % 4
+            f.write(base64.b64decode(chunk[:cut]))
+            carry = chunk[cut:]
+        if carry:
+            f.write(base64.b64decode(carry))  # raises on truncated input
+
+
 def _save_design_image(mission_id: str, image_base64: str, image_filename: str) -> str | None:
     """Save uploaded design image to mission folder."""
     if not image_base64 or not image_filename:
         return None
+
+    out_path = None
     try:
         raw = image_base64.strip()
         if raw.startswith("data:"):
-            match = re.match(r"data:image/([^;]+);base64,", raw)
-            ext = match.group(1).lower() if match else "png"
-            raw = raw.split(",", 1)[1]
+            # Fixed grammar, sliced directly: data:image/<ext>;base64,<payload>
+            header, sep, raw = raw.partition(",")
+            if not sep:
+                raise ValueError("data URL has no payload")
+            mime, _, encoding = header[5:].partition(";")
+            is_image = mime.startswith("image/") and len(mime) > 6 and encoding == "base64"
+            ext = mime[6:].lower() if is_image else "png"
         else:
             ext = "png"
             for suffix in (".png", ".jpg", ".jpeg", ".gif", ".webp"):
                 if image_filename.lower().endswith(suffix):
                     ext = suffix.lstrip(".").lower()
                     break
-        data = base64.b64decode(raw)
         mission_folder = MISSIONS_DIR / mission_id
         mission_folder.mkdir(parents=True, exist_ok=True)
         out_name = f"{DESIGN_REFERENCE_NAME}.{ext}"
         out_path = mission_folder / out_name
-        out_path.write_bytes(data)
-        console.print(f"[cyan][FLEET] Design image saved: {out_name}[/cyan]")
+        _write_base64_file(out_path, raw)
+        _info(f"[cyan][FLEET] Design image saved: {out_name}[/cyan]")
         return out_name
     except Exception as e:
         console.print(f"[yellow][FLEET] Could not save design image: {e}[/yellow]")
+        if out_path is not None:
+            out_path.unlink(missing_ok=True)  # don't leave a half-written image behind
         return None
 
 
+# Natural-language intents, each compiled once into a single alternation so a
+# message is scanned in one pass instead of once per phrase. Callers lowercase
+# the text once: re.IGNORECASE defeats the engine's literal-prefix scan and
+# measured ~10x slower on the status pattern.
+_CLEAR_PROJECTS_RE = re.compile(
+    r"clear (?:all )?projects|clear the (?:projects )?list|clear (?:the )?database"
+    r"|clear everything|clear all|clear missions"
+)
+# Phrases sharing a head ("how ...", "is it ...") are factored into one branch
+_STATUS_QUERY_RE = re.compile(
+    r"status|progress|when will"
+    r"|how(?: is|'s| are|'re| long| much longer)"
+    r"|is it (?:done|ready|complete|finished)"
+)
+_HINT_PREFIX_RE = re.compile(
+    r"what\s+is\s+the\s+status\s+of\s+"
+    r"|what's\s+the\s+status\s+of\s+"
+    r"|how\s+is\s+(?:the\s+)?"
+    r"|how's\s+(?:the\s+)?"
+    r"|status\s+of\s+(?:the\s+)?",
+    re.IGNORECASE,
+)
+
+
 def _is_clear_projects_intent(text: str) -> bool:
     """Return True if the message is a request to clear all projects."""
     if not text or len(text.strip()) < 4:
         return False
-    t = text.strip().lower()
-    phrases = (
-        r"clear (all )?projects",
-        r"clear the (projects )?list",
-        r"clear (the )?database",
-        r"clear everything",
-        r"clear all",
-        r"clear projects",
-        r"clear missions",
-    )
-    return any(re.search(p, t) for p in phrases)
+    return _CLEAR_PROJECTS_RE.search(text.lower()) is not None
 
 
 def _is_status_query(text: str) -> bool:
     """Return True if the message looks like a request for build status."""
     if not text or len(text.strip()) < 3:
         return False
-    t = text.strip().lower()
-    patterns = (
-        "status",
-        "how is",
-        "how's",
-        "how are",
-        "how're",
-        "what is the status",
-        "what's the status",
-        "whats the status",
-        "is it done",
-        "is it ready",
-        "is it complete",
-        "is it finished",
-        "progress",
-        "how long",
-        "when will",
-        "how much longer",
-    )
-    return any(p in t for p in patterns)
+    return _STATUS_QUERY_RE.search(text.lower()) is not None
+
+
+# Pronouns/filler that don't name a project (pre-casefolded).
+_GENERIC_HINTS = frozenset({"it", "that", "this", "build", "app", "going", "the build"})
 
 
 def _extract_project_hint(text: str) -> str | None:
     """Extract a project hint from a status question."""
     if not text or len(text.strip()) < 3:
         return None
-    t = text.strip()
-    prefixes = (
-        r"what\s+is\s+the\s+status\s+of\s+",
-        r"what's\s+the\s+status\s+of\s+",
-        r"how\s+is\s+(?:the\s+)?",
-        r"how's\s+(?:the\s+)?",
-        r"status\s+of\s+(?:the\s+)?",
-    )
-    hint = t
-    for p in prefixes:
-        m = re.match(p, hint, re.IGNORECASE)
-        if m:
-            hint = hint[m.end() :].strip()
-            break
-    hint = re.sub(r"\s*(?:\?|\.|!)\s*$", "", hint)
-    generic = ("it", "that", "this", "build", "app", "going", "the build")
-    if not hint or len(hint) < 2 or hint.lower() in generic:
+    hint = text.strip()
+    m = _HINT_PREFIX_RE.match(hint)
+    if m:
+        hint = hint[m.end() :].strip()
+    hint = hint.rstrip(" \t?.!")
+    if len(hint) < 2 or hint.casefold() in _GENERIC_HINTS:
         return None
     return hint
 
 
+# Only the first ~3KB of the manifest reaches the prompt, so trim it first
+MANIFEST_PREVIEW_FILES = 20
+MANIFEST_PREVIEW_HEAD_CHARS = 400
+MANIFEST_PREVIEW_MAX_CHARS = 3000
+
+
+def _manifest_preview(manifest: dict) -> str:
+    """Serialize a size-bounded view of a manifest for the extension prompt."""
+    import json
+
+    preview = {
+        "project_name": manifest.get("project_name"),
+        "stack": manifest.get("stack"),
+        "files": [
+            {
+                "path": f.get("path"),
+                "head": (f.get("content") or "")[:MANIFEST_PREVIEW_HEAD_CHARS],
+            }
+            for f in manifest.get("files", [])[:MANIFEST_PREVIEW_FILES]
+        ],
+    }
+    return json.dumps(preview, indent=2)[:MANIFEST_PREVIEW_MAX_CHARS]
+
+
 def _elapsed_seconds(created_at: str | None) -> int | None:
-    """Return seconds since created_at."""
+    """Return seconds since created_at (an ISO timestamp; naive means UTC)."""
     if not created_at:
         return None
     try:
-        dt = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
+        # Python 3.11+ parses a trailing "Z" directly, no string rewrite needed
+        dt = datetime.fromisoformat(created_at)
         if dt.tzinfo is None:
             dt = dt.replace(tzinfo=timezone.utc)
         return int((datetime.now(timezone.utc) - dt).total_seconds())
@@ -236,55 +434,93 @@ def _elapsed_seconds(created_at: str | None) -> int | None:
 
 
 class AsyncProgressTracker:
-    """Async progress tracker with WebSocket broadcast."""
+    """
+    Async progress tracker with WebSocket broadcast.
+
+    Trackers don't run their own loop: start() registers with one shared
+    ticker task that queues every active phase for the batched DB writer.
+    """
+
+    # Fixed attribute layout: the ticker reads these for every mission each tick
+    __slots__ = ("_ws_manager", "mission_id", "phase", "start_time")
+
+    _active: ClassVar[dict[str, "AsyncProgressTracker"]] = {}
+    _ticker: ClassVar[asyncio.Task | None] = None
 
     def __init__(
         self,
         mission_id: str,
-        phase: str,
+        phase: str | None,
         ws_manager: "ConnectionManager | None" = None,
     ) -> None:
         self.mission_id = mission_id
         self.phase = phase
-        self.start_time = time.time()
-        self._task: asyncio.Task | None = None
-        self._stop_event = asyncio.Event()
+        self.start_time = time.monotonic()
         self._ws_manager = ws_manager
 
-    async def _update_loop(self) -> None:
-        """Background loop to push progress updates."""
-        while not self._stop_event.is_set():
-            try:
-                await asyncio.wait_for(
-                    self._stop_event.wait(),
-                    timeout=PROGRESS_UPDATE_SECONDS,
-                )
-                break
-            except TimeoutError:
-                elapsed = int(time.time() - self.start_time)
-                update_mission_status(
-                    self.mission_id, self.phase, f"{self.phase}... ({elapsed}s elapsed)"
+    def update_phase(self, phase: str | None) -> None:
+        """
+        Switch the tracked phase without re-registering the tracker.
+
+        One tracker lives for the whole mission; passing None pauses the
+        progress ticks between phases (e.g. while a final status is written).
+        """
+        self.phase = phase
+        self.start_time = time.monotonic()
+
+    @classmethod
+    async def _tick_loop(cls) -> None:
+        """Shared loop: queue every active tracker's progress once per tick."""
+        while cls._active:
+            # Align ticks to a fixed monotonic grid so broadcast/DB time doesn't drift them
+            await asyncio.sleep(
+                PROGRESS_UPDATE_SECONDS - time.monotonic() % PROGRESS_UPDATE_SECONDS
+            )
+            now = time.monotonic()
+            broadcasts = []
+            # Queue every row before the first await, so a tracker stopped mid-tick
+            # can never get a late progress row after its mission's final status
+            for tracker in list(cls._active.values()):
+                phase = tracker.phase
+                if phase is None:
+                    continue
+                elapsed = int(now - tracker.start_time)
+                enqueue_mission_status(
+                    tracker.mission_id, phase, f"{phase}... ({elapsed}s elapsed)"
                 )
-                if self._ws_manager:
-                    await self._ws_manager.broadcast(
-                        self.mission_id,
-                        {"type": "progress", "phase": self.phase, "elapsed": elapsed},
+                if tracker._ws_manager:
+                    broadcasts.append(
+                        tracker._ws_manager.broadcast(
+                            tracker.mission_id,
+                            {"type": "progress", "phase": phase, "elapsed": elapsed},
+                        )
                     )
+            # One slow WebSocket client shouldn't hold up every other mission's tick
+            await asyncio.gather(*broadcasts, return_exceptions=True)
 
     def start(self) -> "AsyncProgressTracker":
-        """Start the progress tracker."""
-        self._task = asyncio.create_task(self._update_loop())
+        """Register with the shared ticker, starting it if it isn't running."""
+        cls = type(self)
+        cls._active[self.mission_id] = self
+        ticker = cls._ticker
+        if ticker is None or ticker.done() or ticker.get_loop() is not asyncio.get_running_loop():
+            cls._ticker = asyncio.create_task(cls._tick_loop())
         return self
 
     async def stop(self) -> None:
-        """Stop the progress tracker."""
-        self._stop_event.set()
-        if self._task:
-            self._task.cancel()
-            try:
-                await self._task
-            except asyncio.CancelledError:
-                pass
+        """Unregister from the shared ticker, cancelling it when no trackers remain."""
+        cls = type(self)
+        if cls._active.get(self.mission_id) is self:
+            del cls._active[self.mission_id]
+
+        ticker = cls._ticker
+        if (
+            not cls._active
+            and ticker is not None
+            and not ticker.done()
+            and ticker.get_loop() is asyncio.get_running_loop()
+        ):
+            ticker.cancel()
 
     async def __aenter__(self) -> "AsyncProgressTracker":
         return self.start()
@@ -308,83 +544,154 @@ class FleetManager:
     """
 
     def __init__(self, ws_manager: "ConnectionManager | None" = None) -> None:
-        """Initialize the Fleet Manager."""
-        init_db()
+        """
+        Initialize the Fleet Manager.
 
+        The schema is not touched here (the constructor may run on the event
+        loop, e.g. on the first request); await startup() or call init_db()
+        once before dispatching missions.
+        """
         self._foundry = Foundry()
         self._policy = PolicyGate()
         self._publisher = Publisher()
-        self._architect: Architect | None = None
-        self._consultant: Consultant | None = None
+        # Credentials come from env at Publisher init; check once, not per mission
+        self._publisher_configured = self._publisher.is_configured()
         self._ws_manager = ws_manager
 
-        # Async semaphore for concurrency control
-        self._mission_semaphore = asyncio.Semaphore(MAX_CONCURRENT_MISSIONS)
-        self._active_missions: dict[str, float] = {}
+        # One breaker per external backend so a flaky provider fails fast alone.
+        # Refusals, audit failures, slow builds and publish blocks are answers,
+        # not outages.
+        self._architect_cb = CircuitBreaker("Architect", trip_on=(ArchitectUnavailableError,))
+        self._foundry_cb = CircuitBreaker("Foundry", ignore=(AuditFailedError, BuildTimeoutError))
+        self._publisher_cb = CircuitBreaker("Publisher", ignore=(SecurityBlock,))
+
+        # Admission control: a running-mission counter under a Condition, so the
+        # cap can be changed at runtime (set_max_concurrent) without a restart
+        self._max_concurrent = MAX_CONCURRENT_MISSIONS
+        self._running_missions = 0
+        self._admission = asyncio.Condition()
+        # Dedicated pool for blocking Architect/Foundry/Publisher calls, sized to the
+        # cap so admitted missions never queue behind unrelated default-executor work
+        self._executor = ThreadPoolExecutor(
+            max_workers=MAX_CONCURRENT_MISSIONS, thread_name_prefix="mission"
+        )
+        # mission_id -> pipeline task; only touched on the event loop, so no lock needed
+        self._active_missions: dict[str, asyncio.Task] = {}
+        # Set by shutdown(); no new missions are spawned after that
+        self._shutting_down = False
+        # mission_id -> latest unsent status frame, drained by one broadcaster task
+        self._pending_broadcasts: dict[str, dict] = {}
+        self._broadcaster: asyncio.Task | None = None
 
         console.print(
             f"[green][FLEET] Fleet Manager v2 (async) online "
             f"(max {MAX_CONCURRENT_MISSIONS} concurrent)[/green]"
         )
 
-    def _get_architect(self) -> Architect:
-        """Lazy init Architect."""
-        if self._architect is None:
-            self._architect = Architect()
-        return self._architect
-
-    def _get_consultant(self) -> Consultant:
-        """Lazy init Consultant."""
-        if self._consultant is None:
-            self._consultant = Consultant()
-        return self._consultant
-
-    async def _broadcast(self, mission_id: str, status: str, message: str) -> None:
-        """Broadcast status update via WebSocket."""
-        if self._ws_manager:
-            await self._ws_manager.broadcast(
-                mission_id,
-                {"type": "status", "mission_id": mission_id, "status": status, "message": message},
+    async def startup(self) -> None:
+        """Ensure the missions schema exists, off the event loop."""
+        await asyncio.get_running_loop().run_in_executor(None, init_db)
+
+    def close(self) -> None:
+        """Shut down the worker pool, flush queued status writes, close the HTTP pools."""
+        # Calls not yet started belong to missions already cancelled; don't run them
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        flush_mission_statuses()
+        if "_architect" in self.__dict__:  # only if it was ever created
+            self._architect.close()
+        self._publisher.close()
+        console.print("[yellow][FLEET] Mission worker pool stopped[/yellow]")
+
+    def refresh_publisher_config(self) -> bool:
+        """Reload GitHub credentials from env (e.g. after a token rotation)."""
+        # The old Publisher may still be mid-publish on a worker; its pool is
+        # released when it is garbage collected rather than closed under it
+        self._publisher = Publisher()
+        self._publisher_configured = self._publisher.is_configured()
+        return self._publisher_configured
+
+    @cached_property
+    def _architect(self) -> Architect:
+        """Lazy init Architect (cached in the instance dict after first access)."""
+        return Architect()
+
+    @cached_property
+    def _consultant(self) -> Consultant:
+        """Lazy init Consultant (cached in the instance dict after first access)."""
+        return Consultant()
+
+    async def _broadcast(
+        self, mission_id: str, status: str, message: str, extra: dict | None = None
+    ) -> None:
+        """
+        Queue a status update for WebSocket clients (returns immediately).
+
+        Frames carry everything a client needs to render the transition (stage
+        label, whether it is final, plus any extra context such as the attempt
+        number or URLs), so it doesn't have to re-fetch the mission over REST.
+
+        Back-to-back transitions (e.g. VALIDATING -> BUILDING) are coalesced:
+        clients get the latest status per mission once per coalescing window.
+        """
+        if not self._ws_manager:
+            return
+        frame = {
+            "type": "status",
+            "mission_id": mission_id,
+            "status": status,
+            "message": message,
+            "stage": STATUS_STAGE_LABELS.get(status, status),
+            "terminal": status in TERMINAL_STATUSES,
+        }
+        if extra:
+            frame.update(extra)
+        self._pending_broadcasts.pop(mission_id, None)  # keep newest last
+        self._pending_broadcasts[mission_id] = frame
+        broadcaster = self._broadcaster
+        if (
+            broadcaster is None
+            or broadcaster.done()
+            or broadcaster.get_loop() is not asyncio.get_running_loop()
+        ):
+            self._broadcaster = asyncio.create_task(self._drain_broadcasts())
+
+    async def _drain_broadcasts(self) -> None:
+        """Send queued status frames, one per mission per window, until none are left."""
+        ws = self._ws_manager
+        if ws is None:
+            return
+        while self._pending_broadcasts:
+            await asyncio.sleep(BROADCAST_COALESCE_SECONDS)
+            pending, self._pending_broadcasts = self._pending_broadcasts, {}
+            await asyncio.gather(
+                *(ws.broadcast(mid, frame) for mid, frame in pending.items()),
+                return_exceptions=True,
             )
 
-    async def _update_status(self, mission_id: str, status: str, speech: str) -> None:
-        """Update mission status in DB and broadcast via WebSocket."""
-        update_mission_status(mission_id, status, speech)
-        await self._broadcast(mission_id, status, speech)
+    async def _update_status(
+        self, mission_id: str, status: str, speech: str, extra: dict | None = None
+    ) -> None:
+        """
+        Update mission status in DB and broadcast via WebSocket.
+
+        In-progress statuses go through the batched writer; anything else is a
+        resting state the API must see immediately, so earlier queued rows are
+        flushed first and it is written before returning (off the event loop).
+        `extra` is only added to the WebSocket frame, never stored.
+        """
+        if status in IN_PROGRESS_STATUSES:
+            enqueue_mission_status(mission_id, status, speech)
+        else:
+            await asyncio.get_running_loop().run_in_executor(
+                None, _write_after_flush, lambda: update_mission_status(mission_id, status, speech)
+            )
+        await self._broadcast(mission_id, status, speech, extra)
 
     def _get_friendly_error(self, error_msg: str) -> str:
         """Convert technical error messages to user-friendly explanations."""
         error_lower = error_msg.lower()
 
-        # Pattern-based error mapping (checked in order)
-        error_patterns = [
-            (
-                "api error 400",
-                "AI model unavailable. The model may not be enabled in your AWS region.",
-            ),
-            ("api error 401", "Authentication failed. Please check your AWS credentials."),
-            ("unauthorized", "Authentication failed. Please check your AWS credentials."),
-            ("api error 403", "Access denied. You may not have permission to use this AI model."),
-            ("forbidden", "Access denied. You may not have permission to use this AI model."),
-            ("api error 429", "Rate limited. Too many requests - please wait and try again."),
-            ("rate limit", "Rate limited. Too many requests - please wait and try again."),
-            (
-                "api error 5",
-                "AI service temporarily unavailable. Please try again in a few minutes.",
-            ),
-            (
-                "server error",
-                "AI service temporarily unavailable. Please try again in a few minutes.",
-            ),
-            ("timeout", "Request timed out. The AI took too long to respond."),
-            ("no valid json", "AI response was malformed. Please try again."),
-            ("api_key", "API key not configured. Please set BEDROCK_API_KEY."),
-            ("bedrock_api_key", "API key not configured. Please set BEDROCK_API_KEY."),
-            ("connection", "Network error. Please check your internet connection."),
-            ("network", "Network error. Please check your internet connection."),
-        ]
-
-        for pattern, friendly_msg in error_patterns:
+        for pattern, friendly_msg in _FRIENDLY_ERRORS:
             if pattern in error_lower:
                 return friendly_msg
 
@@ -417,7 +724,7 @@ class FleetManager:
         4. Start new or continue existing consultation
         5. If ready to build, dispatch build
         """
-        console.print(f"[cyan][FLEET] Processing: {user_input[:50]}...[/cyan]")
+        _info(f"[cyan][FLEET] Processing: {user_input[:50]}...[/cyan]")
 
         # Handle clear projects intent
         if _is_clear_projects_intent(user_input):
@@ -431,12 +738,12 @@ class FleetManager:
         active = get_active_consultation()
 
         if active and active.pending_question:
-            console.print(f"[cyan][FLEET] Continuing consultation: {active.id[:8]}[/cyan]")
+            _info(f"[cyan][FLEET] Continuing consultation: {active.id[:8]}[/cyan]")
             return await self._continue_consultation(
                 active.id, user_input, deploy, publish, image_base64, image_filename
             )
         else:
-            console.print("[cyan][FLEET] Starting new consultation[/cyan]")
+            _info("[cyan][FLEET] Starting new consultation[/cyan]")
             return await self._start_consultation(
                 user_input, deploy, publish, image_base64, image_filename
             )
@@ -456,7 +763,14 @@ class FleetManager:
     def _handle_status_query(self, user_input: str) -> dict:
         """Handle status query from user."""
         hint = _extract_project_hint(user_input)
-        missions = find_missions_by_prompt_hint(hint, limit=15) if hint else list_missions(limit=20)
+        if hint:
+            missions = find_missions_by_prompt_hint(hint, limit=15)
+            in_progress = [m for m in missions if m.status in IN_PROGRESS_STATUSES]
+            missions = in_progress or missions
+        else:
+            # Let SQL find the active build; fall back to the latest of any status
+            missions = find_missions_by_status(IN_PROGRESS_STATUSES, limit=1)
+            missions = missions or list_missions(limit=1)
 
         if not missions:
             return {
@@ -465,12 +779,11 @@ class FleetManager:
                 "mission_id": None,
             }
 
-        in_progress = [m for m in missions if m.status in IN_PROGRESS_STATUSES]
-        mission = in_progress[0] if in_progress else missions[0]
+        mission = missions[0]
 
         stage = STATUS_STAGE_LABELS.get(mission.status, mission.status)
         elapsed = _elapsed_seconds(mission.created_at)
-        project_label = getattr(mission, "design_target", None) or mission.prompt[:40]
+        project_label = mission.design_target or mission.prompt[:40]
 
         if mission.status in IN_PROGRESS_STATUSES:
             elapsed_part = f" In progress for {elapsed}s." if elapsed else ""
@@ -486,6 +799,13 @@ class FleetManager:
             "mission_status": mission.status,
         }
 
+    async def _analyze(self, conversation: list[dict]) -> ConsultantResponse:
+        """Run the consultant's LLM round-trip off the event loop."""
+        consultant = self._consultant
+        return await asyncio.get_running_loop().run_in_executor(
+            None, consultant.analyze, conversation
+        )
+
     async def _start_consultation(
         self,
         prompt: str,
@@ -502,8 +822,7 @@ class FleetManager:
             _save_design_image(mission_id, image_base64, image_filename)
 
         conversation = [{"role": "user", "content": prompt}]
-        consultant = self._get_consultant()
-        response = consultant.analyze(conversation)
+        response = await self._analyze(conversation)
 
         if response.design_target and not design_target:
             set_design_target(mission_id, response.design_target)
@@ -529,14 +848,12 @@ class FleetManager:
         if image_base64 and image_filename:
             _save_design_image(mission_id, image_base64, image_filename)
 
-        clear_pending_question(mission_id)
-        append_to_conversation(mission_id, "user", user_input)
+        commit_user_turn(mission_id, user_input)
 
         conversation = mission.conversation_history or []
         conversation.append({"role": "user", "content": user_input})
 
-        consultant = self._get_consultant()
-        response = consultant.analyze(conversation)
+        response = await self._analyze(conversation)
 
         return await self._handle_consultant_response(
             mission_id, response, conversation, deploy, publish
@@ -551,23 +868,25 @@ class FleetManager:
         publish: bool,
     ) -> dict:
         """Handle the consultant's response."""
-        append_to_conversation(mission_id, "assistant", response.speech)
-
         if response.status == "READY_TO_BUILD":
-            console.print(f"[green][FLEET] Ready to build: {mission_id[:8]}[/green]")
-            mark_ready_to_build(mission_id)
-
-            consultant = self._get_consultant()
-            build_prompt = consultant.get_build_prompt(conversation)
-            design_target = consultant.get_design_target(conversation)
-
-            # Dispatch async build (store reference to prevent GC)
-            task = asyncio.create_task(
+            _info(f"[green][FLEET] Ready to build: {mission_id[:8]}[/green]")
+            commit_consultant_turn(mission_id, response.speech, "READY_TO_BUILD")
+
+            if response.build_prompt is not None:
+                # The consultant already resolved the spec while deciding to build
+                build_prompt, design_target = response.build_prompt, response.design_target
+            else:
+                consultant = self._consultant
+                build_prompt = consultant.get_build_prompt(conversation)
+                design_target = consultant.get_design_target(conversation)
+
+            # Dispatch async build (registered in _active_missions until done)
+            self._spawn_mission(
+                mission_id,
                 self._run_mission_with_target(
                     mission_id, build_prompt, design_target, deploy, publish
-                )
+                ),
             )
-            task.add_done_callback(lambda _: None)
 
             return {
                 "status": "BUILDING",
@@ -577,9 +896,13 @@ class FleetManager:
             }
 
         elif response.status in ("NEEDS_INPUT", "NEEDS_CONFIRMATION"):
-            console.print(f"[yellow][FLEET] Awaiting input: {mission_id[:8]}[/yellow]")
-            set_pending_question(
-                mission_id, response.question or response.speech, response.proposed_stack
+            _info(f"[yellow][FLEET] Awaiting input: {mission_id[:8]}[/yellow]")
+            commit_consultant_turn(
+                mission_id,
+                response.speech,
+                "AWAITING_INPUT",
+                question=response.question or response.speech,
+                proposed_stack=response.proposed_stack,
             )
 
             # Convert iterations to dict format for API
@@ -609,6 +932,7 @@ class FleetManager:
                 "current_iteration": response.current_iteration,
             }
 
+        commit_consultant_turn(mission_id, response.speech)
         return {
             "status": "AWAITING_INPUT",
             "speech": response.speech,
@@ -632,8 +956,7 @@ class FleetManager:
         if not mission:
             return {"status": "error", "speech": "Mission not found.", "mission_id": mission_id}
 
-        retryable = {"FAILED", "BLOCKED", "TIMEOUT", "PUBLISH_FAILED"}
-        if mission.status not in retryable:
+        if mission.status not in RETRYABLE_STATUSES:
             return {
                 "status": "error",
                 "speech": f"Cannot retry: mission is {mission.status}.",
@@ -642,17 +965,16 @@ class FleetManager:
 
         await self._update_status(mission_id, "BUILDING", "Retrying build from scratch.")
 
-        # Store reference to prevent GC
-        task = asyncio.create_task(
+        self._spawn_mission(
+            mission_id,
             self._run_mission_with_target(
                 mission_id,
                 mission.prompt,
-                getattr(mission, "design_target", None),
+                mission.design_target,
                 deploy,
                 publish,
-            )
+            ),
         )
-        task.add_done_callback(lambda _: None)
 
         return {
             "status": "BUILDING",
@@ -721,7 +1043,7 @@ EXISTING FILES: {", ".join(existing_files)}
 
 EXISTING CODE CONTEXT:
 ```json
-{json.dumps(parent_manifest, indent=2)[:3000]}
+{_manifest_preview(parent_manifest)}
 ```
 
 NEW FEATURES TO ADD: {additional_features}
@@ -734,7 +1056,7 @@ IMPORTANT:
 
         # Create new mission linked to parent
         new_mission_id = create_mission(extended_prompt, parent_mission_id=parent_mission_id)
-        iteration_number = parent.iteration_number + 1 if hasattr(parent, "iteration_number") else 2
+        iteration_number = parent.iteration_number + 1
 
         await self._update_status(
             new_mission_id,
@@ -742,17 +1064,16 @@ IMPORTANT:
             f"Extending {project_name} (iteration {iteration_number}).",
         )
 
-        # Run the build asynchronously
-        task = asyncio.create_task(
+        self._spawn_mission(
+            new_mission_id,
             self._run_mission_with_target(
                 new_mission_id,
                 extended_prompt,
                 parent.design_target,
                 deploy,
                 publish,
-            )
+            ),
         )
-        task.add_done_callback(lambda _: None)
 
         return {
             "status": "BUILDING",
@@ -776,22 +1097,122 @@ IMPORTANT:
 
         Creates DB entry and spawns async task.
         Returns immediately with mission ID.
+        Raises RuntimeError once the fleet is shutting down.
         """
+        if self._shutting_down:  # before create_mission, so no row is left PENDING
+            raise RuntimeError("Fleet is shutting down")
         mission_id = create_mission(prompt)
-        console.print(
+        _info(
             f"[cyan][FLEET] Mission queued: {mission_id[:8]} "
             f"(deploy={deploy}, publish={publish})[/cyan]"
         )
 
-        # Store reference to prevent GC
-        task = asyncio.create_task(self._run_mission(mission_id, prompt, deploy, publish))
-        task.add_done_callback(lambda _: None)
+        self._spawn_mission(mission_id, self._run_mission(mission_id, prompt, deploy, publish))
         return mission_id
 
+    def list_active(self) -> list[str]:
+        """IDs of missions whose pipeline task is still queued or running."""
+        return list(self._active_missions)
+
     # =========================================================================
     # MISSION EXECUTION
     # =========================================================================
 
+    @asynccontextmanager
+    async def _mission_slot(self):
+        """Hold one of the fleet's mission slots, waiting while it is full."""
+        async with self._admission:
+            await self._admission.wait_for(lambda: self._running_missions < self._max_concurrent)
+            self._running_missions += 1
+        try:
+            yield
+        finally:
+            # Release before taking the lock, so a cancel during the wait can't leak the slot
+            self._running_missions -= 1
+            async with self._admission:
+                self._admission.notify()
+
+    async def set_max_concurrent(self, limit: int) -> None:
+        """
+        Change how many missions may run at once.
+
+        Raising the cap admits waiting missions immediately; lowering it lets
+        running missions finish and holds new ones until the fleet is under it.
+        """
+        if limit < 1:
+            raise ValueError("max concurrent missions must be at least 1")
+        async with self._admission:
+            previous, self._max_concurrent = self._max_concurrent, limit
+            self._admission.notify_all()
+        if limit != previous:
+            # Executors can't be resized: swap in a new pool; in-flight calls finish on the old one
+            old_executor = self._executor
+            self._executor = ThreadPoolExecutor(max_workers=limit, thread_name_prefix="mission")
+            old_executor.shutdown(wait=False)
+            console.print(f"[cyan][FLEET] Max concurrent missions: {previous} -> {limit}[/cyan]")
+
+    @property
+    def max_concurrent(self) -> int:
+        """Current cap on concurrently running missions."""
+        return self._max_concurrent
+
+    async def cancel_missions(self) -> int:
+        """Cancel every queued or running mission and wait for them to unwind."""
+        tasks = list(self._active_missions.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if tasks:
+            console.print(f"[yellow][FLEET] Cancelled {len(tasks)} mission(s)[/yellow]")
+        return len(tasks)
+
+    async def shutdown(self, timeout: float = SHUTDOWN_GRACE_SECONDS) -> int:
+        """
+        Stop taking missions, give running ones `timeout` seconds, cancel the rest.
+
+        Returns how many missions had to be cancelled.
+        """
+        self._shutting_down = True
+        tasks = list(self._active_missions.values())
+        if tasks:
+            console.print(
+                f"[yellow][FLEET] Draining {len(tasks)} mission(s) (up to {timeout:.0f}s)[/yellow]"
+            )
+            await asyncio.wait(tasks, timeout=timeout)
+        return await self.cancel_missions()
+
+    async def abort_mission(self, mission_id: str) -> bool:
+        """Cancel one queued or running mission; False if it isn't running here."""
+        task = self._active_missions.get(mission_id)
+        if task is None:
+            return False
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        console.print(f"[yellow][FLEET] Aborted mission {mission_id[:8]}[/yellow]")
+        return True
+
+    def _spawn_mission(self, mission_id: str, coro) -> asyncio.Task:
+        """Run a mission pipeline as a task, registered until it finishes."""
+        if self._shutting_down:
+            coro.close()  # never started; close it so it isn't reported as never awaited
+            raise RuntimeError("Fleet is shutting down")
+        task = asyncio.create_task(coro, name=f"mission-{mission_id[:8]}")
+        self._active_missions[mission_id] = task
+
+        def _unregister(done: asyncio.Task) -> None:
+            if self._active_missions.get(mission_id) is done:
+                del self._active_missions[mission_id]
+            # The pipeline records its own failures; anything escaping it is a bug
+            # that would otherwise only surface as "exception never retrieved" at GC
+            if not done.cancelled() and (error := done.exception()) is not None:
+                console.print(
+                    f"[red][FLEET] Mission {mission_id[:8]} task crashed: "
+                    f"{type(error).__name__}: {error}[/red]"
+                )
+
+        task.add_done_callback(_unregister)
+        return task
+
     async def _run_mission(self, mission_id: str, prompt: str, deploy: bool, publish: bool) -> None:
         """Execute mission pipeline (direct build without design target)."""
         await self._run_mission_with_target(mission_id, prompt, None, deploy, publish)
@@ -805,119 +1226,142 @@ IMPORTANT:
         publish: bool,
     ) -> None:
         """Execute mission pipeline with design target."""
-        async with self._mission_semaphore:
-            mission_start = time.time()
-            self._active_missions[mission_id] = mission_start
-
-            try:
-                # Phase 1: Architecting
-                await self._update_status(
-                    mission_id, "ARCHITECTING", f"Drafting {design_target or 'custom'} blueprint."
+        tag = f"[Mission {mission_id[:8]}]"  # log prefix, built once per mission
+        # Decide once whether this mission can open a PR; phases just read the flag
+        publish = self._publish_effective(publish, tag)
+        try:
+            async with self._mission_slot():
+                await self._execute_mission(
+                    mission_id, prompt, design_target, deploy, publish, tag=tag
                 )
+        except asyncio.CancelledError:
+            # abort_mission() or shutdown, whether queued for a slot or running:
+            # leave a final status, not PENDING or a stale phase
+            console.print(f"[yellow]{tag} Cancelled[/yellow]")
+            await self._update_status(mission_id, "FAILED", "Mission cancelled.")
+            raise
+
+    async def _execute_mission(
+        self,
+        mission_id: str,
+        prompt: str,
+        design_target: str | None,
+        deploy: bool,
+        publish: bool,
+        *,
+        tag: str,
+    ) -> None:
+        """Run the mission phases; the caller holds a mission slot."""
+        # Monotonic deadline computed once: immune to wall-clock jumps
+        deadline = time.monotonic() + MISSION_TIMEOUT_SECONDS
+
+        # One progress tracker per mission; phases switch it instead of respawning it
+        tracker = AsyncProgressTracker(mission_id, None, self._ws_manager).start()
+
+        try:
+            # Phase 1: Architecting
+            await self._update_status(
+                mission_id, "ARCHITECTING", f"Drafting {design_target or 'custom'} blueprint."
+            )
 
-                async with AsyncProgressTracker(mission_id, "ARCHITECTING", self._ws_manager):
-                    architect = self._get_architect()
-                    # Pass mission_id for vision/mockup support
-                    manifest = await asyncio.get_event_loop().run_in_executor(
-                        None,
-                        lambda: architect.draft_blueprint(
-                            prompt, design_target=design_target, mission_id=mission_id
+            tracker.update_phase("ARCHITECTING")
+            try:
+                architect = self._architect
+                # Pass mission_id for vision/mockup support; stream only when watched
+                async with self._progress_steps(mission_id, "ARCHITECTING") as report:
+                    manifest = await asyncio.get_running_loop().run_in_executor(
+                        self._executor,
+                        lambda: self._architect_cb.call(
+                            architect.draft_blueprint,
+                            prompt,
+                            design_target=design_target,
+                            mission_id=mission_id,
+                            progress=report,
                         ),
                     )
+            finally:
+                tracker.update_phase(None)
 
-                if time.time() - mission_start > MISSION_TIMEOUT_SECONDS:
-                    raise BuildTimeoutError("Mission timeout exceeded")
-
-                # Phase 2: Validation
-                await self._phase_validate(mission_id, manifest)
-
-                # Phase 3: Build with self-healing
-                result = await self._phase_build(mission_id, manifest, deploy, mission_start)
-                if not result:
-                    return
-
-                # Phase 4: Publishing
-                pr_url = await self._phase_publish(mission_id, manifest, publish, result.deploy_url)
-
-                # Final status
-                await self._finalize_mission(mission_id, result.deploy_url, pr_url)
-
-            except ArchitectError as e:
-                error_str = str(e).lower()
-                console.print(f"[red][Mission {mission_id[:8]}] Architect failed: {e}[/red]")
-
-                # Detect copyright/trademark issues and provide conversational guidance
-                trademark_indicators = [
-                    "copyright",
-                    "trademark",
-                    "brand",
-                    "cannot create",
-                    "cannot generate",
-                    "proprietary",
-                    "intellectual property",
-                    "unable to replicate",
-                    "cannot replicate",
-                    "clone",
-                    "cannot clone",
-                ]
-                brand_names = [
-                    "tesla",
-                    "apple",
-                    "google",
-                    "microsoft",
-                    "amazon",
-                    "meta",
-                    "facebook",
-                    "twitter",
-                    "netflix",
-                    "spotify",
-                    "airbnb",
-                    "uber",
-                    "linkedin",
-                    "instagram",
-                ]
+            if time.monotonic() > deadline:
+                raise BuildTimeoutError("Mission timeout exceeded")
 
-                is_trademark_issue = any(ind in error_str for ind in trademark_indicators)
-                mentioned_brand = next((b for b in brand_names if b in prompt.lower()), None)
-
-                if is_trademark_issue or mentioned_brand:
-                    # Conversational response suggesting alternatives
-                    if mentioned_brand:
-                        suggestion = (
-                            f"I can't directly clone {mentioned_brand.title()}'s website due to "
-                            f"copyright protection. Try rephrasing like: 'Build a {mentioned_brand.title()}-inspired "
-                            f"landing page' or 'Build a modern electric car company website with dark theme'. "
-                            f"What would you like me to build instead?"
-                        )
-                    else:
-                        suggestion = (
-                            "I can't directly clone trademarked websites. Try describing the style you want "
-                            "instead of naming a specific brand. For example: 'Build a modern SaaS landing page "
-                            "with dark theme and gradient accents'. What would you like me to build?"
-                        )
-                    await self._update_status(mission_id, "AWAITING_INPUT", suggestion)
+            # Phase 2: Validation
+            if not await self._phase_validate(mission_id, manifest, tag):
+                return  # BLOCKED is final; don't let the build overwrite it
+
+            # Phase 3: Build with self-healing
+            result = await self._phase_build(
+                mission_id, manifest, deploy, deadline, tracker=tracker, tag=tag
+            )
+            if not result:
+                return
+
+            # Phase 4: Publishing (publish already folds in SKIP_PUBLISH and credentials)
+            pr_url = (
+                await self._phase_publish(
+                    mission_id, manifest, publish, result.deploy_url, tracker=tracker, tag=tag
+                )
+                if publish
+                else None
+            )
+
+            # Final status
+            await self._finalize_mission(mission_id, result.deploy_url, pr_url)
+
+        except ArchitectError as e:
+            error_str = str(e).lower()
+            console.print(f"[red]{tag} Architect failed: {e}[/red]")
+
+            # Detect copyright/trademark issues and provide conversational guidance
+            is_trademark_issue = _TRADEMARK_REFUSAL_RE.search(error_str) is not None
+            prompt_lower = prompt.lower()
+            mentioned_brand = next((b for b in _BRAND_NAMES if b in prompt_lower), None)
+
+            if is_trademark_issue or mentioned_brand:
+                # Conversational response suggesting alternatives
+                if mentioned_brand:
+                    suggestion = (
+                        f"I can't directly clone {mentioned_brand.title()}'s website due to "
+                        f"copyright protection. Try rephrasing like: 'Build a {mentioned_brand.title()}-inspired "
+                        f"landing page' or 'Build a modern electric car company website with dark theme'. "
+                        f"What would you like me to build instead?"
+                    )
                 else:
-                    # Provide clear, user-friendly error reason
-                    error_msg = str(e)
-                    user_friendly_reason = self._get_friendly_error(error_msg)
-                    await self._update_status(
-                        mission_id, "FAILED", f"Blueprint failed: {user_friendly_reason}"
+                    suggestion = (
+                        "I can't directly clone trademarked websites. Try describing the style you want "
+                        "instead of naming a specific brand. For example: 'Build a modern SaaS landing page "
+                        "with dark theme and gradient accents'. What would you like me to build?"
                     )
+                await self._update_status(mission_id, "AWAITING_INPUT", suggestion)
+            else:
+                # Provide clear, user-friendly error reason
+                error_msg = str(e)
+                user_friendly_reason = self._get_friendly_error(error_msg)
+                await self._update_status(
+                    mission_id, "FAILED", f"Blueprint failed: {user_friendly_reason}"
+                )
 
-            except BuildTimeoutError:
-                await self._update_status(mission_id, "TIMEOUT", "Mission timeout exceeded.")
-
-            except SecurityViolation:
-                await self._update_status(mission_id, "BLOCKED", "Policy violation.")
+        except Exception as e:
+            status, build_speech = _classify(e, MISSION_FAILURES) or _UNEXPECTED_FAILURE
+            console.print(f"[red]{tag} {status}: {e}[/red]")
+            await self._update_status(mission_id, status, build_speech(e))
 
-            except Exception as e:
-                console.print(f"[red][Mission {mission_id[:8]}] Error: {e}[/red]")
-                await self._update_status(mission_id, "FAILED", f"Error: {str(e)[:100]}")
+        finally:
+            await tracker.stop()
 
-            finally:
-                self._active_missions.pop(mission_id, None)
+    def _publish_effective(self, publish: bool, tag: str) -> bool:
+        """Fold the request flag, GANTRY_SKIP_PUBLISH and credentials into one flag."""
+        if not publish:
+            return False
+        if SKIP_PUBLISH:
+            _info(f"[dim]{tag} Publishing skipped (GANTRY_SKIP_PUBLISH)[/dim]")
+            return False
+        if not self._publisher_configured:
+            _info(f"[dim]{tag} Publishing skipped (GitHub not configured)[/dim]")
+            return False
+        return True
 
-    async def _phase_validate(self, mission_id: str, manifest: GantryManifest) -> bool:
+    async def _phase_validate(self, mission_id: str, manifest: GantryManifest, tag: str) -> bool:
         """Validate manifest against policy."""
         await self._update_status(mission_id, "VALIDATING", "Running security check.")
 
@@ -925,7 +1369,7 @@ IMPORTANT:
             self._policy.validate(manifest)
             return True
         except SecurityViolation as e:
-            console.print(f"[red][Mission {mission_id[:8]}] Policy violation: {e}[/red]")
+            console.print(f"[red]{tag} Policy violation: {e}[/red]")
             await self._update_status(mission_id, "BLOCKED", "Policy violation.")
             return False
 
@@ -934,111 +1378,206 @@ IMPORTANT:
         mission_id: str,
         manifest: GantryManifest,
         deploy: bool,
-        mission_start: float,
+        deadline: float,
+        *,
+        tracker: AsyncProgressTracker,
+        tag: str,
     ):
         """Build with self-healing loop."""
-        architect = self._get_architect()
+        architect = self._architect
         current_manifest = manifest
 
         for attempt in range(1, MAX_RETRIES + 1):
-            if time.time() - mission_start > MISSION_TIMEOUT_SECONDS:
-                raise BuildTimeoutError("Mission timeout during build")
+            remaining = deadline - time.monotonic()
+            if remaining < MIN_BUILD_BUDGET_SEC:
+                raise BuildTimeoutError(
+                    f"Insufficient budget ({remaining:.0f}s) for build attempt {attempt}"
+                )
 
             await self._update_status(
                 mission_id,
                 "BUILDING",
                 f"Building {current_manifest.project_name}. Attempt {attempt}.",
+                {"attempt": attempt, "project_name": current_manifest.project_name},
             )
 
-            async with AsyncProgressTracker(mission_id, "BUILDING", self._ws_manager):
-                try:
-                    # Capture current_manifest by value using default arg
-                    m = current_manifest
-                    result = await asyncio.get_event_loop().run_in_executor(
-                        None, lambda m=m: self._foundry.build(m, mission_id, deploy=deploy)
-                    )
-                    console.print(f"[green][Mission {mission_id[:8]}] Build PASSED[/green]")
-                    return result
-
-                except (AuditFailedError, DeploymentError) as e:
-                    error_log = str(e) if isinstance(e, DeploymentError) else e.output
-                    console.print(
-                        f"[yellow][Mission {mission_id[:8]}] Build failed (attempt {attempt}): "
-                        f"{error_log[:200]}...[/yellow]"
+            tracker.update_phase("BUILDING")
+            try:
+                result = await self._try_build(current_manifest, mission_id, deploy)
+                _info(f"[green]{tag} Build PASSED[/green]")
+                return result
+
+            except Exception as e:
+                policy = _classify(e)
+                if policy is None:
+                    raise
+                label, build_context = policy
+                error_log = build_context(e)
+                console.print(
+                    f"[yellow]{tag} {label} failed (attempt {attempt}): "
+                    f"{error_log[:200]}...[/yellow]"
+                )
+                if not _is_healable(e, error_log):
+                    # Pause ticks first so no BUILDING row lands after the final status
+                    tracker.update_phase(None)
+                    await self._update_status(
+                        mission_id, "FAILED", f"{label} failed on a configuration error; no retry."
                     )
+                    return None
 
-                    if attempt < MAX_RETRIES:
-                        await self._update_status(
-                            mission_id, "HEALING", f"Build failed. Self-repair attempt {attempt}."
+                if attempt < MAX_RETRIES:
+                    await self._update_status(
+                        mission_id,
+                        "HEALING",
+                        f"Build failed. Self-repair attempt {attempt}.",
+                        {"attempt": attempt, "project_name": current_manifest.project_name},
+                    )
+                    tracker.update_phase("HEALING")  # covers the heal call and the backoff
+                    try:
+                        # Capture variables by value
+                        m, err = current_manifest, error_log
+                        healed = await asyncio.get_running_loop().run_in_executor(
+                            self._executor,
+                            lambda m=m, err=err: self._architect_cb.call(
+                                architect.heal_blueprint, m, err
+                            ),
                         )
-                        try:
-                            # Capture variables by value
-                            m, err = current_manifest, error_log
-                            healed = await asyncio.get_event_loop().run_in_executor(
-                                None, lambda m=m, err=err: architect.heal_blueprint(m, err)
-                            )
-                            # Only update if healing succeeded and produced different code
-                            if healed and healed != current_manifest:
-                                console.print(
-                                    f"[green][Mission {mission_id[:8]}] Healing produced new manifest[/green]"
-                                )
-                                current_manifest = healed
-                            else:
-                                console.print(
-                                    f"[yellow][Mission {mission_id[:8]}] Healing returned same code, "
-                                    f"will retry with different approach[/yellow]"
-                                )
-                        except ArchitectError as heal_err:
+                        # Only update if healing succeeded and produced different code
+                        if healed and healed != current_manifest:
+                            _info(f"[green]{tag} Healing produced new manifest[/green]")
+                            current_manifest = healed
+                        else:
                             console.print(
-                                f"[red][Mission {mission_id[:8]}] Healing failed: {heal_err}[/red]"
+                                f"[yellow]{tag} Healing returned same code, "
+                                f"will retry with different approach[/yellow]"
                             )
-                            # Don't silently pass - log that healing failed
-                            # The next attempt will still try with current_manifest
-                            # but at least we know healing isn't working
+                    except ArchitectError as heal_err:
+                        console.print(f"[red]{tag} Healing failed: {heal_err}[/red]")
+                        # Don't silently pass - log that healing failed
+                        # The next attempt will still try with current_manifest
+                        # but at least we know healing isn't working
+
+                    # Jittered backoff so concurrent missions don't retry in lockstep;
+                    # skipped when the wait alone would blow the mission budget
+                    backoff_cap = HEAL_BACKOFF_BASE_SECONDS * 2 ** (attempt - 1)
+                    delay = random.uniform(0, min(HEAL_BACKOFF_MAX_SECONDS, backoff_cap))
+                    if time.monotonic() + delay <= deadline:
+                        await asyncio.sleep(delay)
 
-                except BuildTimeoutError:
-                    raise
+            finally:
+                tracker.update_phase(None)
 
         await self._update_status(mission_id, "FAILED", f"Failed after {MAX_RETRIES} attempts.")
         return None
 
+    async def _try_build(self, manifest: GantryManifest, mission_id: str, deploy: bool):
+        """Run one Foundry build on the mission pool, through the Foundry breaker."""
+        async with self._progress_steps(mission_id, "BUILDING") as report:
+            kwargs = (
+                {"deploy": deploy} if report is None else {"deploy": deploy, "progress": report}
+            )
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executor,
+                lambda: self._foundry_cb.call(self._foundry.build, manifest, mission_id, **kwargs),
+            )
+
+    @asynccontextmanager
+    async def _progress_steps(self, mission_id: str, phase: str):
+        """
+        Yield a step listener for a worker-thread call, or None with no WebSocket.
+
+        Each step the worker reports is queued and forwarded as a progress frame
+        while the call is still running.
+        """
+        if not self._ws_manager:
+            yield None
+            return
+
+        loop = asyncio.get_running_loop()
+        steps: asyncio.Queue[str | None] = asyncio.Queue(maxsize=PROGRESS_STEP_QUEUE_SIZE)
+
+        def _offer(step: str) -> None:
+            if not steps.full():  # never block or grow: a stalled client loses steps
+                steps.put_nowait(step)
+
+        def _report(step: str) -> None:  # called on the worker thread
+            loop.call_soon_threadsafe(_offer, step)
+
+        forwarder = asyncio.create_task(self._forward_steps(mission_id, phase, steps))
+        try:
+            yield _report
+        finally:
+            # Steps reported before the call returned are already queued ahead of this
+            if steps.full():
+                forwarder.cancel()
+            else:
+                steps.put_nowait(None)
+            await asyncio.gather(forwarder, return_exceptions=True)
+
+    async def _forward_steps(self, mission_id: str, phase: str, steps: asyncio.Queue) -> None:
+        """Broadcast queued steps until the None sentinel arrives."""
+        ws = self._ws_manager
+        if ws is None:
+            return
+        while (step := await steps.get()) is not None:
+            await ws.broadcast(mission_id, {"type": "progress", "phase": phase, "step": step})
+
     async def _phase_publish(
         self,
         mission_id: str,
         manifest: GantryManifest,
         publish: bool,
         deploy_url: str | None,
+        *,
+        tracker: AsyncProgressTracker,
+        tag: str,
     ) -> str | None:
-        """Publish to GitHub via PR."""
-        if SKIP_PUBLISH or not publish or not self._publisher.is_configured():
+        """Publish to GitHub via PR (publish is the effective flag from _publish_effective)."""
+        if not publish:
             return None
 
         await self._update_status(mission_id, "PUBLISHING", "Opening Pull Request.")
 
-        async with AsyncProgressTracker(mission_id, "PUBLISHING", self._ws_manager):
-            try:
-                evidence_path = MISSIONS_DIR / mission_id
-                pr_url = await asyncio.get_event_loop().run_in_executor(
-                    None,
-                    lambda: self._publisher.publish_mission(
-                        manifest, str(evidence_path), mission_id=mission_id
-                    ),
-                )
-                console.print(f"[green][Mission {mission_id[:8]}] PR opened: {pr_url}[/green]")
-                return pr_url
-            except (SecurityBlock, PublishError) as e:
-                console.print(f"[red][Mission {mission_id[:8]}] Publish failed: {e}[/red]")
-                return None
+        tracker.update_phase("PUBLISHING")
+        try:
+            evidence_path = MISSIONS_DIR / mission_id
+            pr_url = await asyncio.get_running_loop().run_in_executor(
+                self._executor,
+                lambda: self._publisher_cb.call(
+                    self._publisher.publish_mission,
+                    manifest,
+                    str(evidence_path),
+                    mission_id=mission_id,
+                ),
+            )
+            _info(f"[green]{tag} PR opened: {pr_url}[/green]")
+            return pr_url
+        except (SecurityBlock, PublishError, CircuitOpenError) as e:
+            console.print(f"[red]{tag} Publish failed: {e}[/red]")
+            return None
+        finally:
+            tracker.update_phase(None)
 
     async def _finalize_mission(
         self, mission_id: str, deploy_url: str | None, pr_url: str | None
     ) -> None:
-        """Set final mission status."""
+        """Set final mission status (status, speech and URLs in one transaction)."""
         if deploy_url and pr_url:
-            await self._update_status(mission_id, "DEPLOYED", f"Live at {deploy_url}. PR opened.")
+            status, speech = "DEPLOYED", f"Live at {deploy_url}. PR opened."
         elif deploy_url:
-            await self._update_status(mission_id, "DEPLOYED", f"Live at {deploy_url}")
+            status, speech = "DEPLOYED", f"Live at {deploy_url}"
         elif pr_url:
-            await self._update_status(mission_id, "PR_OPENED", "PR opened for review.")
+            status, speech = "PR_OPENED", "PR opened for review."
         else:
-            await self._update_status(mission_id, "SUCCESS", "Build verified.")
+            status, speech = "SUCCESS", "Build verified."
+
+        await asyncio.get_running_loop().run_in_executor(
+            None,
+            _write_after_flush,
+            lambda: finalize_mission(
+                mission_id, status=status, speech=speech, deploy_url=deploy_url, pr_url=pr_url
+            ),
+        )
+        await self._broadcast(
+            mission_id, status, speech, {"deploy_url": deploy_url, "pr_url": pr_url}
+        )
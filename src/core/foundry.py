@@ -21,7 +21,7 @@
 # Safety Features:
 # - Dead Man's Switch: 180 second hard timeout
 # - Resource Limits: 512MB memory cap
-# - Black Box: Every step is logged to flight_recorder.json
+# - Black Box: Every step is appended to flight_recorder.jsonl as it happens
 #
 # This is the "Body" of the Fleet Protocol. It has NO knowledge of AI/LLMs.
 # -----------------------------------------------------------------------------
@@ -31,9 +31,11 @@ import json
 import os
 import tarfile
 import threading
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
+from typing import TextIO, TypedDict
 
 import docker
 from docker.errors import APIError, ImageNotFound
@@ -79,13 +81,17 @@ class AuditFailedError(Exception):
         self.output = output
 
 
-@dataclass
-class FlightLogEntry:
-    """A single entry in the flight recorder."""
+def _write_json(path: Path, obj: object) -> None:
+    """Write an evidence file as indented JSON in one write (json.dump writes per token)."""
+    path.write_text(json.dumps(obj, indent=2))
+
+
+class FlightLogEntry(TypedDict):
+    """A single line of the flight recorder."""
 
     timestamp: str
     event: str
-    details: str | None = None
+    details: str | None
 
 
 @dataclass
@@ -106,7 +112,7 @@ class BlackBox:
     Every mission creates a dedicated folder with:
     - manifest.json: The fabrication instructions
     - audit_pass.json OR audit_fail.json: The verdict
-    - flight_recorder.json: Complete session log
+    - flight_recorder.jsonl: Session log, one JSON event per line as it happens
 
     Why: "Black Box" Evidence requirement. Even failed missions leave a trail.
     """
@@ -115,30 +121,34 @@ class BlackBox:
         self.mission_id = mission_id
         self.folder = MISSIONS_DIR / mission_id
         self.folder.mkdir(parents=True, exist_ok=True)
-        self._log: list[FlightLogEntry] = []
+        self._recorder_path = self.folder / "flight_recorder.jsonl"
+        self._recorder: TextIO | None = None  # opened on the first event
 
         console.print(f"[cyan][BLACKBOX] Evidence folder: {self.folder}[/cyan]")
 
     def log(self, event: str, details: str | None = None) -> None:
         """Record an event in the flight recorder."""
-        entry = FlightLogEntry(
-            timestamp=datetime.utcnow().isoformat(), event=event, details=details
-        )
-        self._log.append(entry)
+        entry: FlightLogEntry = {
+            "timestamp": datetime.utcnow().isoformat(),
+            "event": event,
+            "details": details,
+        }
+        if self._recorder is None:
+            # Line-buffered append, kept open until finalize(): each event reaches
+            # the file when logged, so a killed build still leaves its trail on disk
+            self._recorder = self._recorder_path.open("a", buffering=1)
+        self._recorder.write(json.dumps(entry) + "\n")
 
     def save_manifest(self, manifest: GantryManifest) -> None:
         """Save manifest.json to evidence folder."""
         path = self.folder / "manifest.json"
-        with open(path, "w") as f:
-            json.dump(manifest.model_dump(), f, indent=2)
+        _write_json(path, manifest.model_dump())
         self.log("MANIFEST_SAVED", str(path))
 
     def save_audit_pass(self, output: str) -> None:
         """Save audit_pass.json - The Critic approved."""
         report = {"timestamp": datetime.utcnow().isoformat(), "verdict": "PASS", "output": output}
-        path = self.folder / "audit_pass.json"
-        with open(path, "w") as f:
-            json.dump(report, f, indent=2)
+        _write_json(self.folder / "audit_pass.json", report)
         self.log("AUDIT_PASSED")
 
     def save_audit_fail(self, exit_code: int, output: str) -> None:
@@ -149,24 +159,16 @@ class BlackBox:
             "exit_code": exit_code,
             "output": output,
         }
-        path = self.folder / "audit_fail.json"
-        with open(path, "w") as f:
-            json.dump(report, f, indent=2)
+        _write_json(self.folder / "audit_fail.json", report)
         self.log("AUDIT_FAILED", f"Exit code: {exit_code}")
 
     def finalize(self) -> None:
-        """Save flight_recorder.json - Complete session log."""
-        path = self.folder / "flight_recorder.json"
-        with open(path, "w") as f:
-            json.dump(
-                [
-                    {"timestamp": e.timestamp, "event": e.event, "details": e.details}
-                    for e in self._log
-                ],
-                f,
-                indent=2,
-            )
-        console.print(f"[green][BLACKBOX] Flight recorder saved: {path}[/green]")
+        """Close flight_recorder.jsonl - every event is already on disk."""
+        if self._recorder is not None:
+            self._recorder.close()
+            # A later log() (e.g. cleanup failing after finalize) reopens in append mode
+            self._recorder = None
+        console.print(f"[green][BLACKBOX] Flight recorder saved: {self._recorder_path}[/green]")
 
 
 class Foundry:
@@ -379,8 +381,8 @@ class Foundry:
                 info.mode = 0o644
                 tar.addfile(info, io.BytesIO(content))
 
-        tar_buffer.seek(0)
-        return tar_buffer.read()
+        # getvalue() hands over the buffer; seek(0) + read() copied the whole archive
+        return tar_buffer.getvalue()
 
     def _find_design_reference(self, mission_folder: Path) -> str | None:
         """Find design-reference image in mission folder (design-reference.png, .jpg, etc.)."""
@@ -395,15 +397,14 @@ class Foundry:
     def _create_design_image_tar(self, mission_folder: Path, design_ref: str) -> bytes | None:
         """Create tar containing design-reference image as public/design-reference.{ext}."""
         src = mission_folder / design_ref
-        if not src.exists() or not src.is_file():
+        if not src.is_file() or src.stat().st_size == 0:  # an empty upload has nothing to show
             return None
         tar_buffer = io.BytesIO()
         with tarfile.open(fileobj=tar_buffer, mode="w") as tar:
             info = tar.gettarinfo(str(src), arcname=f"public/{design_ref}")
             with open(src, "rb") as f:
                 tar.addfile(info, f)
-        tar_buffer.seek(0)
-        return tar_buffer.read()
+        return tar_buffer.getvalue()
 
     def _ensure_image(self, image: str) -> None:
         """Pull image if not present."""
@@ -415,7 +416,13 @@ class Foundry:
             self._client.images.pull(image)
             console.print(f"[green][FOUNDRY] Pulled: {image}[/green]")
 
-    def build(self, manifest: GantryManifest, mission_id: str, deploy: bool = True) -> BuildResult:
+    def build(
+        self,
+        manifest: GantryManifest,
+        mission_id: str,
+        deploy: bool = True,
+        progress: Callable[[str], None] | None = None,
+    ) -> BuildResult:
         """
         Execute Fabrication Instructions in a Project Pod.
 
@@ -423,6 +430,8 @@ class Foundry:
             manifest: The GantryManifest (Fabrication Instructions).
             mission_id: Mission ID for evidence tracking.
             deploy: Whether to deploy to Vercel (default True, set False for tests).
+            progress: Optional callback, called from this (worker) thread with a
+                short label as each build step starts.
 
         Returns:
             BuildResult with audit outcome.
@@ -442,6 +451,14 @@ class Foundry:
         container: Container | None = None
         timeout_triggered = threading.Event()
 
+        def _report(step: str) -> None:
+            """Tell the caller which step started; a failing listener never fails the build."""
+            if progress:
+                try:
+                    progress(step)
+                except Exception:
+                    pass
+
         def _dead_mans_switch():
             """Kill container after timeout."""
             timeout_triggered.set()
@@ -470,6 +487,7 @@ class Foundry:
             blackbox.log("IMAGE_READY", image)
 
             # Spawn Pod with resource limits
+            _report("Starting build container")
             console.print(f"[cyan][FOUNDRY] Spawning Pod (mem: {MEMORY_LIMIT})...[/cyan]")
 
             try:
@@ -513,6 +531,7 @@ class Foundry:
                 raise BuildTimeoutError("Dead Man's Switch triggered")
 
             # Inject files
+            _report(f"Copying {len(manifest.files)} files")
             console.print(f"[cyan][FOUNDRY] Injecting {len(manifest.files)} files...[/cyan]")
             tar_data = self._create_tar(manifest)
             container.put_archive("/workspace", tar_data)
@@ -534,6 +553,7 @@ class Foundry:
             # Install dependencies if requirements.txt exists (Python)
             has_requirements = any(f.path == "requirements.txt" for f in manifest.files)
             if has_requirements and manifest.stack == StackType.PYTHON:
+                _report("Installing dependencies")
                 console.print("[cyan][FOUNDRY] Installing Python dependencies...[/cyan]")
                 blackbox.log("DEPS_INSTALL_STARTED", "requirements.txt")
 
@@ -558,6 +578,7 @@ class Foundry:
             # Install dependencies if package.json exists (Node)
             has_package_json = any(f.path == "package.json" for f in manifest.files)
             if has_package_json and manifest.stack == StackType.NODE:
+                _report("Installing dependencies")
                 console.print("[cyan][FOUNDRY] Installing Node dependencies...[/cyan]")
                 blackbox.log("DEPS_INSTALL_STARTED", "package.json")
 
@@ -573,6 +594,7 @@ class Foundry:
                 raise BuildTimeoutError("Dead Man's Switch triggered")
 
             # Run Critic (audit_command) with timeout protection
+            _report("Running tests")
             console.print(f"[cyan][FOUNDRY] Running audit: {manifest.audit_command}[/cyan]")
             blackbox.log("AUDIT_STARTED", manifest.audit_command)
 
@@ -603,6 +625,7 @@ class Foundry:
 
             # STRUCTURE CHECK: Verify Vercel serverless format before deploying
             if manifest.stack in (StackType.NODE, StackType.PYTHON):
+                _report("Checking deployment structure")
                 blackbox.log("STRUCTURE_CHECK_STARTED", "Verifying Vercel format")
 
                 structure_valid = self._verify_serverless_structure(container, manifest)
@@ -626,6 +649,7 @@ class Foundry:
                 console.print("[yellow][FOUNDRY] Vercel deployment skipped (deploy=false)[/yellow]")
                 blackbox.log("DEPLOY_SKIPPED", "deploy=false")
             elif self._deployer.is_configured() and self._use_builder_image:
+                _report("Deploying to Vercel")
                 blackbox.log("DEPLOY_STARTED", "Vercel")
                 try:
                     deploy_url = self._deployer.deploy_mission(container, project_name)
@@ -80,6 +80,22 @@ class PolicyGate:
         """
         self._policy_path = policy_path
         self._config: PolicyConfig = self._load_policy()
+        # Compiled once per policy load; the source string is kept for violation details
+        patterns = self._config.forbidden_patterns
+        self._forbidden: list[tuple[str, re.Pattern[str]]] = [
+            (pattern, re.compile(pattern, re.IGNORECASE)) for pattern in patterns
+        ]
+        # Bytes twins for ASCII-only files (nearly all generated code): same matches,
+        # without Unicode case folding. Only possible when every pattern is ASCII and
+        # compiles as bytes (escapes like \u00e9, \N{...} or (?u) don't).
+        self._forbidden_ascii: list[tuple[str, re.Pattern[bytes]]] | None = None
+        if all(pattern.isascii() for pattern in patterns):
+            try:
+                self._forbidden_ascii = [
+                    (pattern, re.compile(pattern.encode(), re.IGNORECASE)) for pattern in patterns
+                ]
+            except re.error:
+                pass  # fall back to scanning every file as str
         console.print(
             f"[green][GATEKEEPER] Policy loaded: {len(self._config.forbidden_patterns)} forbidden patterns[/green]"
         )
@@ -160,13 +176,19 @@ class PolicyGate:
     def _check_forbidden_patterns(self, manifest: GantryManifest) -> None:
         """Scan file contents for forbidden patterns."""
         for file_spec in manifest.files:
-            for pattern in self._config.forbidden_patterns:
-                if re.search(pattern, file_spec.content, re.IGNORECASE):
-                    console.print(
-                        f"[red][GATEKEEPER] Access Denied: Forbidden pattern in {file_spec.path}[/red]"
-                    )
-                    raise SecurityViolation(
-                        f"Access Denied: Forbidden pattern detected in {file_spec.path}",
-                        rule="forbidden_patterns",
-                        details=f"Pattern: {pattern}",
-                    )
+            content = file_spec.content
+            hit: str | None
+            if self._forbidden_ascii is not None and content.isascii():
+                data = content.encode()
+                hit = next((p for p, rx in self._forbidden_ascii if rx.search(data)), None)
+            else:
+                hit = next((p for p, rx in self._forbidden if rx.search(content)), None)
+            if hit is not None:
+                console.print(
+                    f"[red][GATEKEEPER] Access Denied: Forbidden pattern in {file_spec.path}[/red]"
+                )
+                raise SecurityViolation(
+                    f"Access Denied: Forbidden pattern detected in {file_spec.path}",
+                    rule="forbidden_patterns",
+                    details=f"Pattern: {hit}",
+                )
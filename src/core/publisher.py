@@ -36,6 +36,8 @@ import shutil
 import uuid
 from pathlib import Path
 
+import requests
+from requests.adapters import HTTPAdapter
 from rich.console import Console
 
 from src.domain.models import GantryManifest
@@ -50,6 +52,9 @@ from src.infra.git_client import (
 
 console = Console()
 
+# Keep-alive GitHub API connections kept per Publisher (repo create + PR per mission)
+GITHUB_POOL_SIZE = 4
+
 
 class SecurityBlock(Exception):
     """Raised when attempting to publish a failed mission."""
@@ -101,6 +106,17 @@ class Publisher:
         if self._token and self._username:
             console.print("[green][PUBLISHER] GitHub credentials loaded[/green]")
 
+        # Pooled keep-alive session: back-to-back API calls and later missions
+        # reuse the TCP/TLS connection to api.github.com
+        self._session = requests.Session()
+        self._session.mount(
+            "https://", HTTPAdapter(pool_connections=1, pool_maxsize=GITHUB_POOL_SIZE)
+        )
+
+    def close(self) -> None:
+        """Close the pooled GitHub API connections."""
+        self._session.close()
+
     def is_configured(self) -> bool:
         """Check if GitHub credentials are available."""
         return bool(self._token and self._username)
@@ -246,7 +262,9 @@ class Publisher:
 
         # AUTO-CREATE REPOSITORY via GitHub API (with main branch initialized)
         try:
-            create_github_repo(token=self._token, repo_name=target_repo, private=False)
+            create_github_repo(
+                token=self._token, repo_name=target_repo, private=False, session=self._session
+            )
         except RepoCreationError as e:
             console.print(f"[yellow][PUBLISHER] Repo note: {e}[/yellow]")
             # Continue - repo might already exist
@@ -283,6 +301,7 @@ class Publisher:
                 title=f"Gantry Mission: {manifest.project_name}",
                 body=pr_body,
                 base="main",
+                session=self._session,
             )
 
             console.print(f"[green][PUBLISHER] PR opened: {pr_url}[/green]")
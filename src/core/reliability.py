@@ -0,0 +1,145 @@
+# Copyright 2026 Pramod Kumar Voola
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# -----------------------------------------------------------------------------
+# RELIABILITY - CIRCUIT BREAKERS
+# -----------------------------------------------------------------------------
+# Responsibility: Stop hammering an external backend (Bedrock, Docker/Vercel,
+# GitHub) once it is clearly down, so missions fail fast instead of burning
+# their whole retry budget and MISSION_TIMEOUT.
+#
+# States:
+# - CLOSED:    calls pass through; consecutive failures are counted
+# - OPEN:      calls are rejected with CircuitOpenError until recovery_timeout
+# - HALF_OPEN: a limited number of probe calls decide CLOSED vs OPEN
+# -----------------------------------------------------------------------------
+
+import threading
+import time
+from collections.abc import Callable
+from typing import TypeVar
+
+from rich.console import Console
+
+console = Console()
+
+T = TypeVar("T")
+
+CLOSED = "CLOSED"
+OPEN = "OPEN"
+HALF_OPEN = "HALF_OPEN"
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the backend's breaker is open."""
+
+    pass
+
+
+class CircuitBreaker:
+    """
+    Per-backend circuit breaker.
+
+    Thread-safe: calls arrive from the mission worker pool. Exceptions listed
+    in ``ignore`` mean the backend answered (e.g. an audit failed), so they
+    count as a successful call before being re-raised. When ``trip_on`` is
+    given, only those exceptions count as failures and any other error is
+    treated as an answer too.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 60.0,
+        half_open_max: int = 1,
+        ignore: tuple[type[BaseException], ...] = (),
+        *,
+        trip_on: tuple[type[BaseException], ...] = (Exception,),
+    ) -> None:
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max = half_open_max
+        self._ignore = ignore
+        self._trip_on = trip_on
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._half_open_calls = 0
+
+    @property
+    def state(self) -> str:
+        """Current state (OPEN turns into HALF_OPEN once recovery_timeout elapses)."""
+        with self._lock:
+            if self._state == OPEN and time.monotonic() - self._opened_at >= self.recovery_timeout:
+                return HALF_OPEN
+            return self._state
+
+    def _before_call(self) -> None:
+        """Admit or reject a call, moving OPEN -> HALF_OPEN when it is time to probe."""
+        with self._lock:
+            if self._state == OPEN:
+                if time.monotonic() - self._opened_at < self.recovery_timeout:
+                    raise CircuitOpenError(f"{self.name} is unavailable (circuit open)")
+                self._state = HALF_OPEN
+                self._half_open_calls = 0
+
+            if self._state == HALF_OPEN:
+                if self._half_open_calls >= self.half_open_max:
+                    raise CircuitOpenError(f"{self.name} is recovering (circuit half-open)")
+                self._half_open_calls += 1
+
+    def _on_success(self) -> None:
+        with self._lock:
+            if self._state != CLOSED:
+                console.print(f"[green][BREAKER] {self.name} recovered[/green]")
+            self._state = CLOSED
+            self._failures = 0
+            self._half_open_calls = 0
+
+    def _on_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != OPEN:
+                    console.print(
+                        f"[red][BREAKER] {self.name} circuit OPEN "
+                        f"after {self._failures} failure(s)[/red]"
+                    )
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+
+    def call(self, func: Callable[..., T], *args, **kwargs) -> T:
+        """
+        Invoke func through the breaker.
+
+        Raises:
+            CircuitOpenError: If the breaker is open (func is not called).
+        """
+        self._before_call()
+        try:
+            result = func(*args, **kwargs)
+        except self._ignore:
+            self._on_success()
+            raise
+        except Exception as e:
+            if isinstance(e, self._trip_on):
+                self._on_failure()
+            else:
+                self._on_success()
+            raise
+        self._on_success()
+        return result
@@ -52,7 +52,13 @@ class RepoCreationError(Exception):
     pass
 
 
-def create_github_repo(token: str, repo_name: str, private: bool = False) -> str:
+def create_github_repo(
+    token: str,
+    repo_name: str,
+    private: bool = False,
+    *,
+    session: requests.Session | None = None,
+) -> str:
     """
     Create a new GitHub repository via API.
 
@@ -62,6 +68,7 @@ def create_github_repo(token: str, repo_name: str, private: bool = False) -> str
         token: GitHub Personal Access Token with 'repo' scope
         repo_name: Name for the new repository
         private: Whether to create a private repo (default: public)
+        session: Optional pooled session to reuse connections (default: one-off)
 
     Returns:
         The repository clone URL
@@ -85,7 +92,7 @@ def create_github_repo(token: str, repo_name: str, private: bool = False) -> str
     }
 
     try:
-        response = requests.post(
+        response = (session or requests).post(
             f"{GITHUB_API_URL}/user/repos", headers=headers, json=payload, timeout=30
         )
 
@@ -135,6 +142,8 @@ def create_pull_request(
     title: str,
     body: str,
     base: str = "main",
+    *,
+    session: requests.Session | None = None,
 ) -> str:
     """
     Create a Pull Request via GitHub API.
@@ -149,6 +158,7 @@ def create_pull_request(
         title: PR title
         body: PR description
         base: Target branch (default: main)
+        session: Optional pooled session to reuse connections (default: one-off)
 
     Returns:
         The Pull Request URL
@@ -167,7 +177,7 @@ def create_pull_request(
     payload = {"title": title, "body": body, "head": branch, "base": base}
 
     try:
-        response = requests.post(
+        response = (session or requests).post(
             f"{GITHUB_API_URL}/repos/{username}/{repo_name}/pulls",
             headers=headers,
             json=payload,
@@ -40,8 +40,10 @@
 # - GET  /gantry/missions : List missions
 # - POST /gantry/missions/clear : Clear all
 # - POST /gantry/missions/{id}/retry : Retry failed
+# - POST /gantry/missions/{id}/abort : Cancel a running mission
 # - GET  /gantry/missions/{id}/failure : Failure details
 # - GET  /gantry/search : Search missions
+# - PUT  /gantry/fleet/concurrency : Resize mission admission
 # - WS   /gantry/ws/{id} : Real-time updates
 # -----------------------------------------------------------------------------
 
@@ -52,7 +54,7 @@ import sys
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, Any
 
 from fastapi import (
     Depends,
@@ -91,7 +93,7 @@ from src.core.auth import (
     verify_session,
 )
 from src.core.db import delete_mission, get_mission, init_db, list_missions
-from src.core.fleet import FleetManager
+from src.core.fleet import TERMINAL_STATUSES, FleetManager
 from src.skills import load_skills
 
 console = Console()
@@ -130,12 +132,18 @@ class ConnectionManager:
 
     async def broadcast(self, mission_id: str, message: dict) -> None:
         """Broadcast message to all clients watching a mission."""
-        if mission_id in self.active_connections:
-            for connection in self.active_connections[mission_id]:
-                try:
-                    await connection.send_json(message)
-                except Exception:
-                    pass
+        connections = self.active_connections.get(mission_id)
+        if not connections:
+            return
+        # Serialize once for every watcher (send_json would re-encode per client);
+        # same compact encoding Starlette's send_json uses
+        payload = json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+        # Write to every watcher concurrently: one slow client doesn't delay the
+        # rest, and a dead socket's error is swallowed without stopping them
+        await asyncio.gather(
+            *(connection.send_text(payload) for connection in list(connections)),
+            return_exceptions=True,
+        )
 
     def get_connection_count(self) -> int:
         """Get total active connections (for health check)."""
@@ -161,7 +169,8 @@ async def lifespan(_app: FastAPI):
 
     # Startup
     print_banner()
-    init_db()
+    # Schema DDL off the loop; the fleet itself is created lazily and relies on it
+    await asyncio.get_running_loop().run_in_executor(None, init_db)
     load_skills()
 
     # Create missions directory
@@ -175,6 +184,10 @@ async def lifespan(_app: FastAPI):
 
     # Shutdown
     console.print("[yellow]GANTRY FLEET SHUTTING DOWN[/yellow]")
+    if _fleet is not None:
+        # Let running missions finish (bounded), then cancel what's left
+        await _fleet.shutdown()
+        _fleet.close()
 
 
 app = FastAPI(
@@ -576,19 +589,10 @@ async def architect(
     )
 
     if wait:
-        terminal_states = [
-            "SUCCESS",
-            "DEPLOYED",
-            "PR_OPENED",
-            "FAILED",
-            "BLOCKED",
-            "TIMEOUT",
-            "CRITICAL_FAILURE",
-        ]
         for _ in range(40):  # 40 * 3s = 120s
             await asyncio.sleep(3)
             mission = get_mission(mission_id)
-            if mission and mission.status in terminal_states:
+            if mission and mission.status in TERMINAL_STATUSES:
                 return BuildResponse(
                     status=mission.status,
                     mission_id=mission_id,
@@ -726,6 +730,24 @@ async def retry_mission(
     return result
 
 
+@app.post("/gantry/missions/{mission_id}/abort")
+async def abort_mission(
+    mission_id: str,
+    _ip: Annotated[None, Depends(rate_limit_ip)],
+    _user_id: Annotated[str, Depends(get_current_user)],
+):
+    """Cancel a queued or running mission (it is left FAILED, "Mission cancelled.")."""
+    fleet = get_fleet()
+    if not await fleet.abort_mission(mission_id):
+        raise HTTPException(status_code=404, detail="Mission is not running")
+
+    return {
+        "aborted": True,
+        "mission_id": mission_id,
+        "speech": f"Mission {mission_id[:8]} cancelled.",
+    }
+
+
 class ExtendRequest(BaseModel):
     """Request to extend an existing mission with new features."""
 
@@ -778,13 +800,29 @@ async def get_mission_failure(
 ):
     """Get failure details for a mission from audit evidence."""
     missions_dir = PROJECT_ROOT / "missions" / mission_id
-    out = {"mission_id": mission_id, "failure": None, "speech": "No failure details on file."}
+    out: dict[str, Any] = {
+        "mission_id": mission_id,
+        "failure": None,
+        "speech": "No failure details on file.",
+    }
 
-    for name in ("audit_fail.json", "flight_recorder.json"):
+    # flight_recorder.json is the whole-array log written by older builds
+    for name in ("audit_fail.json", "flight_recorder.jsonl", "flight_recorder.json"):
         path = missions_dir / name
         if not path.is_file():
             continue
         try:
+            if name.endswith(".jsonl"):
+                # A build killed mid-write leaves a partial last line; keep the rest
+                events: list[dict] = []
+                for line in path.read_text().splitlines():
+                    try:
+                        events.append(json.loads(line))
+                    except ValueError:
+                        continue
+                out["failure"] = events
+                out["speech"] = "Flight recording available."
+                break
             data = json.loads(path.read_text())
             if name == "audit_fail.json":
                 out["failure"] = {
@@ -831,6 +869,32 @@ async def search_similar(
     }
 
 
+# =============================================================================
+# FLEET SETTINGS
+# =============================================================================
+
+
+class ConcurrencyRequest(BaseModel):
+    """Request to change how many missions run at once."""
+
+    max_concurrent: int = Field(..., ge=1, le=32, description="Missions allowed to run at once")
+
+
+@app.put("/gantry/fleet/concurrency")
+async def set_fleet_concurrency(
+    request: ConcurrencyRequest,
+    _ip: Annotated[None, Depends(rate_limit_ip)],
+    _user_id: Annotated[str, Depends(get_current_user)],
+):
+    """Resize mission admission at runtime (running missions are never interrupted)."""
+    fleet = get_fleet()
+    await fleet.set_max_concurrent(request.max_concurrent)
+    return {
+        "max_concurrent": fleet.max_concurrent,
+        "active_missions": len(fleet.list_active()),
+    }
+
+
 # =============================================================================
 # WEBSOCKET - REAL-TIME UPDATES
 # =============================================================================
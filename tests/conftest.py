@@ -22,6 +22,8 @@ os.environ.setdefault("DB_PORT", "5432")
 os.environ.setdefault("DB_USER", "test")
 os.environ.setdefault("DB_PASSWORD", "test")
 os.environ.setdefault("DB_NAME", "test_db")
+# Mocked connections differ per test; don't let cached reads leak between them
+os.environ.setdefault("GANTRY_READ_CACHE_TTL", "0")
 
 
 @pytest.fixture
@@ -2,14 +2,27 @@
 Tests for the Architect module (AI integration).
 """
 
+import base64
 import json
 import os
+import struct
+import zlib
 from unittest.mock import MagicMock, patch
 
 import pytest
+import requests
 from src.domain.models import FileSpec, GantryManifest, StackType
 
 
+def _event_frame(event: dict) -> bytes:
+    """Encode a model event as one AWS event-stream frame with valid CRCs."""
+    chunk = base64.b64encode(json.dumps(event).encode()).decode()
+    payload = json.dumps({"bytes": chunk}).encode()
+    prelude = struct.pack(">II", 12 + len(payload) + 4, 0)
+    message = prelude + struct.pack(">I", zlib.crc32(prelude)) + payload
+    return message + struct.pack(">I", zlib.crc32(message))
+
+
 class TestArchitect:
     """Tests for Architect AI integration."""
 
@@ -151,7 +164,7 @@ class TestArchitectInit:
 class TestArchitectMethods:
     """Test Architect methods with mocking."""
 
-    @patch("src.core.architect.requests.post")
+    @patch("src.core.architect.requests.Session.post")
     def test_draft_blueprint_calls_api(self, mock_post):
         """draft_blueprint should call Bedrock API."""
         from src.core.architect import Architect
@@ -183,10 +196,10 @@ class TestArchitectMethods:
             assert manifest.project_name == "TestApp"
             mock_post.assert_called_once()
 
-    @patch("src.core.architect.requests.post")
+    @patch("src.core.architect.requests.Session.post")
     def test_draft_blueprint_handles_api_error(self, mock_post):
         """draft_blueprint should handle API errors."""
-        from src.core.architect import Architect, ArchitectError
+        from src.core.architect import Architect, ArchitectUnavailableError
 
         mock_response = MagicMock()
         mock_response.status_code = 500
@@ -196,10 +209,97 @@ class TestArchitectMethods:
         with patch.dict(os.environ, {"BEDROCK_API_KEY": "test-key"}):
             architect = Architect()
 
-            with pytest.raises(ArchitectError):
+            with pytest.raises(ArchitectUnavailableError):
+                architect.draft_blueprint("Build something")
+
+    @patch("src.core.architect.requests.Session.post")
+    def test_draft_blueprint_client_error_is_not_an_outage(self, mock_post):
+        """A 4xx answer is a plain ArchitectError, not an outage for the breaker."""
+        from src.core.architect import Architect, ArchitectError, ArchitectUnavailableError
+
+        mock_response = MagicMock()
+        mock_response.status_code = 400
+        mock_response.text = "Bad Request"
+        mock_post.return_value = mock_response
+
+        with patch.dict(os.environ, {"BEDROCK_API_KEY": "test-key"}):
+            architect = Architect()
+
+            with pytest.raises(ArchitectError) as exc_info:
                 architect.draft_blueprint("Build something")
 
-    @patch("src.core.architect.requests.post")
+        assert not isinstance(exc_info.value, ArchitectUnavailableError)
+
+    @patch("src.core.architect.STREAM_PROGRESS_CHARS", 10)
+    @patch("src.core.architect.requests.Session.post")
+    def test_draft_blueprint_streams_with_progress(self, mock_post):
+        """With a progress listener the draft is streamed and reported as it arrives."""
+        from src.core.architect import Architect
+
+        text = json.dumps(
+            {
+                "project_name": "StreamApp",
+                "stack": "node",
+                "files": [{"path": "index.js", "content": "console.log('hi');"}],
+                "audit_command": "node index.js",
+                "run_command": "node index.js",
+            }
+        )
+        body = b"".join(
+            _event_frame({"type": "content_block_delta", "delta": {"text": text[i : i + 40]}})
+            for i in range(0, len(text), 40)
+        ) + _event_frame({"type": "message_delta", "usage": {"output_tokens": 42}})
+        mock_response = MagicMock(status_code=200)
+        # Split mid-frame to exercise buffering across network chunks
+        mock_response.iter_content.return_value = [body[:7], body[7:50], body[50:]]
+        mock_post.return_value = mock_response
+
+        steps = []
+        with patch.dict(os.environ, {"BEDROCK_API_KEY": "test-key"}):
+            architect = Architect()
+            manifest = architect.draft_blueprint("Build a hello world app", progress=steps.append)
+
+        assert manifest.project_name == "StreamApp"
+        assert mock_post.call_args[0][0].endswith("/invoke-with-response-stream")
+        assert mock_post.call_args[1]["stream"] is True
+        assert steps[0].startswith("Drafting blueprint:")
+        assert steps[-1] == "Blueprint drafted: 42 tokens"
+
+    def test_event_stream_rejects_corrupt_frame(self):
+        """A frame whose CRC doesn't match is rejected rather than parsed."""
+        from src.core.architect import _iter_event_payloads
+
+        frame = bytearray(_event_frame({"type": "message_delta"}))
+        frame[-5] ^= 0xFF  # flip a payload byte; the message CRC no longer matches
+
+        with pytest.raises(ValueError, match="CRC"):
+            list(_iter_event_payloads([bytes(frame)]))
+
+    @patch("time.sleep")
+    @patch("src.core.architect.requests.Session.post")
+    def test_stream_interrupted_mid_body_is_retried(self, mock_post, _sleep):
+        """A dropped stream is retried, and every response is closed."""
+        from src.core.architect import Architect
+
+        text = json.dumps({"response": "ok", "ready_to_build": False})
+        dropped = MagicMock(status_code=200)
+        dropped.iter_content.side_effect = requests.exceptions.ChunkedEncodingError("reset")
+        throttled = MagicMock(status_code=503)
+        good = MagicMock(status_code=200)
+        good.iter_content.return_value = [
+            _event_frame({"type": "content_block_delta", "delta": {"text": text}})
+        ]
+        mock_post.side_effect = [dropped, throttled, good]
+
+        with patch.dict(os.environ, {"BEDROCK_API_KEY": "test-key"}):
+            architect = Architect()
+            result = architect._call_model_api("model", "system", "hi", progress=lambda _: None)
+
+        assert result == text
+        for response in (dropped, throttled, good):
+            response.__exit__.assert_called_once()
+
+    @patch("src.core.architect.requests.Session.post")
     def test_consult_returns_response(self, mock_post):
         """consult should return response dict."""
         from src.core.architect import Architect
@@ -227,7 +327,7 @@ class TestArchitectMethods:
             assert "response" in result
             assert result["ready_to_build"] is False
 
-    @patch("src.core.architect.requests.post")
+    @patch("src.core.architect.requests.Session.post")
     def test_consult_handles_ready_to_build(self, mock_post):
         """consult should detect ready_to_build flag."""
         from src.core.architect import Architect
@@ -261,7 +361,7 @@ class TestArchitectMethods:
 
             assert result["ready_to_build"] is True
 
-    @patch("src.core.architect.requests.post")
+    @patch("src.core.architect.requests.Session.post")
     def test_heal_blueprint_calls_api(self, mock_post):
         """heal_blueprint should call Bedrock API for fixes."""
         from src.core.architect import Architect
@@ -277,7 +377,10 @@ class TestArchitectMethods:
                             "stack": "node",
                             "files": [
                                 {"path": "index.js", "content": "console.log('fixed');"},
-                                {"path": "tests/index.test.js", "content": "console.log('All tests passed!');"},
+                                {
+                                    "path": "tests/index.test.js",
+                                    "content": "console.log('All tests passed!');",
+                                },
                             ],
                             "audit_command": "node tests/index.test.js",
                             "run_command": "node index.js",
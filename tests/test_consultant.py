@@ -0,0 +1,78 @@
+"""
+Tests for the consultation agent.
+"""
+
+from unittest.mock import MagicMock, patch
+
+from src.core.consultant import Consultant, ConsultantResponse
+
+
+def _bedrock_reply(status: str, confidence: float) -> MagicMock:
+    """Build a fake successful Bedrock HTTP response."""
+    reply = MagicMock(status_code=200)
+    reply.json.return_value = {
+        "content": [
+            {
+                "text": (
+                    f'{{"status": "{status}", "question": "Which features?", '
+                    f'"speech": "Which features?", "confidence": {confidence}}}'
+                )
+            }
+        ]
+    }
+    return reply
+
+
+class TestConsultantCache:
+    """Tests for reusing recent analyses of identical conversations."""
+
+    @patch("src.core.consultant.requests.post")
+    def test_identical_conversation_reuses_analysis(self, mock_post):
+        """The second identical conversation should not call Bedrock again."""
+        mock_post.return_value = _bedrock_reply("NEEDS_CONFIRMATION", 0.7)
+        consultant = Consultant(api_key="test-key")
+        conversation = [{"role": "user", "content": "A todo app"}]
+
+        first = consultant.analyze(conversation)
+        second = consultant.analyze([{"content": "A todo app", "role": "user"}])
+
+        assert mock_post.call_count == 1
+        assert second == first
+        assert second is not first  # callers get their own copy
+
+        consultant.analyze([{"role": "user", "content": "A weather app"}])
+        assert mock_post.call_count == 2
+
+    @patch("src.core.consultant.requests.post")
+    def test_low_confidence_answers_are_not_cached(self, mock_post):
+        """Unsure answers should be asked again rather than replayed."""
+        mock_post.return_value = _bedrock_reply("NEEDS_INPUT", 0.1)
+        consultant = Consultant(api_key="test-key")
+        conversation = [{"role": "user", "content": "An app"}]
+
+        consultant.analyze(conversation)
+        response = consultant.analyze(conversation)
+
+        assert mock_post.call_count == 2
+        assert isinstance(response, ConsultantResponse)
+
+
+class TestConsultantBuildSpec:
+    """Tests for resolving the build spec alongside the decision."""
+
+    @patch("src.core.consultant.requests.post")
+    def test_confirmation_carries_build_prompt_and_target(self, mock_post):
+        """A local READY_TO_BUILD should include the final prompt and design target."""
+        consultant = Consultant(api_key="test-key")
+        conversation = [
+            {"role": "user", "content": "A twitter clone with dark mode"},
+            {"role": "assistant", "content": "Any other features?"},
+            {"role": "user", "content": "yes"},
+        ]
+
+        response = consultant.analyze(conversation)
+
+        mock_post.assert_not_called()
+        assert response.status == "READY_TO_BUILD"
+        assert response.build_prompt == "A twitter clone with dark mode"
+        assert response.design_target == "TWITTER"
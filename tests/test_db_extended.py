@@ -5,6 +5,7 @@
 # =============================================================================
 
 import os
+from datetime import UTC, datetime
 from unittest.mock import MagicMock, patch
 
 
@@ -146,3 +147,189 @@ class TestDatabaseFunctions:
         from src.core.db import close_pool
 
         assert callable(close_pool)
+
+    @patch("src.core.db.get_connection")
+    def test_commit_consultant_turn_single_statement(self, mock_conn):
+        """commit_consultant_turn should append and update status in one statement."""
+        from src.core.db import commit_consultant_turn
+
+        mock_cursor = MagicMock()
+        conn = mock_conn.return_value.__enter__.return_value
+        conn.cursor.return_value.__enter__.return_value = mock_cursor
+
+        commit_consultant_turn("test-uuid-123", "Ready!", "READY_TO_BUILD")
+
+        mock_cursor.execute.assert_called_once()
+        sql, params = mock_cursor.execute.call_args[0]
+        assert "READY_TO_BUILD" in sql
+        assert "Ready!" in params[0]
+
+    @patch("src.core.db.get_connection")
+    def test_commit_user_turn_appends_and_clears_question(self, mock_conn):
+        """commit_user_turn should append the reply and clear the question in one statement."""
+        from src.core.db import commit_user_turn
+
+        mock_cursor = MagicMock()
+        conn = mock_conn.return_value.__enter__.return_value
+        conn.cursor.return_value.__enter__.return_value = mock_cursor
+
+        commit_user_turn("test-uuid-123", "Use React please")
+
+        mock_cursor.execute.assert_called_once()
+        sql, params = mock_cursor.execute.call_args[0]
+        assert "pending_question = NULL" in sql
+        assert "||" in sql
+        assert "Use React please" in params[0]
+
+    @patch("src.core.db.get_connection")
+    def test_find_missions_by_status_filters_in_sql(self, mock_conn):
+        """find_missions_by_status should push the status filter into the query."""
+        from src.core.db import find_missions_by_status
+
+        mock_cursor = MagicMock()
+        mock_cursor.fetchall.return_value = []
+        conn = mock_conn.return_value.__enter__.return_value
+        conn.cursor.return_value.__enter__.return_value = mock_cursor
+
+        assert find_missions_by_status(frozenset({"HEALING", "BUILDING"}), limit=1) == []
+        assert find_missions_by_status(frozenset()) == []
+
+        mock_cursor.execute.assert_called_once()
+        sql, params = mock_cursor.execute.call_args[0]
+        assert "status = ANY(%s)" in sql
+        assert params == (["BUILDING", "HEALING"], 1)
+
+    @patch("src.core.db.get_connection")
+    def test_find_missions_by_status_maps_iteration_fields(self, mock_conn):
+        """Records should carry the same iteration and URL fields as get_mission."""
+        from src.core.db import find_missions_by_status
+
+        mock_cursor = MagicMock()
+        mock_cursor.fetchall.return_value = [
+            {
+                "id": "child-uuid",
+                "prompt": "Make it blue",
+                "status": "HEALING",
+                "speech_output": None,
+                "created_at": datetime(2026, 1, 1, tzinfo=UTC),
+                "updated_at": None,
+                "parent_mission_id": "parent-uuid",
+                "iteration_number": 2,
+                "deploy_url": "https://app.example",
+                "pr_url": "https://github.com/x/y/pull/1",
+            }
+        ]
+        conn = mock_conn.return_value.__enter__.return_value
+        conn.cursor.return_value.__enter__.return_value = mock_cursor
+
+        (record,) = find_missions_by_status(frozenset({"HEALING"}))
+
+        assert record.parent_mission_id == "parent-uuid"
+        assert record.iteration_number == 2
+        assert record.deploy_url == "https://app.example"
+        assert record.pr_url == "https://github.com/x/y/pull/1"
+
+    @patch("src.core.db.get_connection")
+    def test_finalize_mission_writes_status_and_urls_together(self, mock_conn):
+        """finalize_mission should write status, speech and URLs in one statement."""
+        from src.core.db import finalize_mission
+
+        mock_cursor = MagicMock()
+        conn = mock_conn.return_value.__enter__.return_value
+        conn.cursor.return_value.__enter__.return_value = mock_cursor
+
+        finalize_mission(
+            "test-uuid-123", status="DEPLOYED", speech="Live.", deploy_url="https://x", pr_url=None
+        )
+
+        mock_cursor.execute.assert_called_once()
+        _sql, params = mock_cursor.execute.call_args[0]
+        assert params == ("DEPLOYED", "Live.", "https://x", None, "test-uuid-123")
+
+    @patch("src.core.db.execute_values")
+    @patch("src.core.db.get_connection")
+    def test_update_mission_statuses_uses_one_statement(self, mock_conn, mock_execute_values):
+        """Batched status rows should go out as a single UPDATE ... FROM (VALUES ...)."""
+        from src.core.db import update_mission_statuses
+
+        rows = [("id-a", "BUILDING", "Attempt 1."), ("id-b", "HEALING", None)]
+        update_mission_statuses(rows)
+
+        mock_execute_values.assert_called_once()
+        _cursor, sql, passed_rows = mock_execute_values.call_args[0]
+        assert "FROM (VALUES %s)" in sql
+        assert passed_rows == rows
+
+
+class TestReadCache:
+    """Test the TTL cache in front of mission reads."""
+
+    @patch("src.core.db.READ_CACHE_TTL_SECONDS", 60.0)
+    @patch("src.core.db.get_connection")
+    def test_repeat_reads_hit_cache_until_a_write(self, mock_conn):
+        """Repeat list_missions calls share one query; any local write invalidates."""
+        from src.core.db import invalidate_read_cache, list_missions, update_mission_status
+
+        invalidate_read_cache()
+        mock_cursor = MagicMock()
+        mock_cursor.fetchall.return_value = []
+        conn = mock_conn.return_value.__enter__.return_value
+        conn.cursor.return_value.__enter__.return_value = mock_cursor
+
+        assert list_missions(limit=20) == []
+        assert list_missions(limit=20) == []
+        assert mock_cursor.execute.call_count == 1
+
+        list_missions(limit=5)  # different arguments, different entry
+        assert mock_cursor.execute.call_count == 2
+
+        update_mission_status("test-uuid-123", "BUILDING")
+        list_missions(limit=20)
+        assert mock_cursor.execute.call_count == 4  # the UPDATE plus a fresh SELECT
+        invalidate_read_cache()
+
+    @patch("src.core.db.READ_CACHE_TTL_SECONDS", 60.0)
+    @patch("src.core.db.get_connection")
+    def test_cached_records_are_copies(self, mock_conn):
+        """Mutating a returned record must not leak into the cache or other callers."""
+        from src.core.db import get_mission, invalidate_read_cache
+
+        invalidate_read_cache()
+        mock_cursor = MagicMock()
+        mock_cursor.fetchone.return_value = {
+            "id": "mission-a",
+            "prompt": "todo app",
+            "status": "AWAITING_INPUT",
+            "speech_output": None,
+            "created_at": datetime(2026, 1, 1, tzinfo=UTC),
+            "updated_at": None,
+            "conversation_history": [{"role": "user", "content": "hi"}],
+        }
+        conn = mock_conn.return_value.__enter__.return_value
+        conn.cursor.return_value.__enter__.return_value = mock_cursor
+
+        first = get_mission("mission-a")
+        first.conversation_history.append({"role": "user", "content": "uncommitted"})
+        second = get_mission("mission-a")
+        second.conversation_history.append({"role": "user", "content": "also uncommitted"})
+
+        assert mock_cursor.execute.call_count == 1
+        assert get_mission("mission-a").conversation_history == [{"role": "user", "content": "hi"}]
+        invalidate_read_cache()
+
+    @patch("src.core.db.READ_CACHE_TTL_SECONDS", 60.0)
+    @patch("src.core.db.get_connection")
+    def test_list_keyword_arguments_are_cacheable(self, mock_conn):
+        """A list passed by keyword should key the cache like a positional one."""
+        from src.core.db import find_missions_by_status, invalidate_read_cache
+
+        invalidate_read_cache()
+        mock_cursor = MagicMock()
+        mock_cursor.fetchall.return_value = []
+        conn = mock_conn.return_value.__enter__.return_value
+        conn.cursor.return_value.__enter__.return_value = mock_cursor
+
+        assert find_missions_by_status(statuses=["BUILDING"]) == []
+        assert find_missions_by_status(statuses=["BUILDING"]) == []
+        assert mock_cursor.execute.call_count == 1
+        invalidate_read_cache()
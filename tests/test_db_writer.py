@@ -0,0 +1,35 @@
+"""
+Tests for the batched mission status writer.
+"""
+
+from unittest.mock import patch
+
+from src.core import db_writer
+
+
+class TestDbWriter:
+    """Tests for enqueue/flush coalescing."""
+
+    @patch("src.core.db_writer.update_mission_statuses")
+    def test_flush_writes_latest_row_per_mission_in_one_batch(self, mock_update_many):
+        """Queued rows should coalesce per mission into a single batched write."""
+        db_writer.enqueue_mission_status("mission-a", "BUILDING", "Attempt 1.")
+        db_writer.enqueue_mission_status("mission-b", "ARCHITECTING", "Drafting.")
+        db_writer.enqueue_mission_status("mission-a", "HEALING", "Self-repair.")
+
+        assert db_writer.flush(timeout=2)
+
+        rows = [row for call in mock_update_many.call_args_list for row in call[0][0]]
+        assert ("mission-a", "HEALING", "Self-repair.") in rows
+        assert ("mission-a", "BUILDING", "Attempt 1.") not in rows
+        assert ("mission-b", "ARCHITECTING", "Drafting.") in rows
+
+    @patch("src.core.db_writer.update_mission_statuses", side_effect=RuntimeError("db down"))
+    def test_flush_survives_write_errors(self, mock_update_many):
+        """A failed batch should not kill the writer thread."""
+        db_writer.enqueue_mission_status("mission-c", "BUILDING")
+        assert db_writer.flush(timeout=2)
+
+        db_writer.enqueue_mission_status("mission-c", "HEALING")
+        assert db_writer.flush(timeout=2)
+        assert mock_update_many.call_count >= 2
@@ -4,11 +4,37 @@
 # Comprehensive tests for async fleet orchestration.
 # =============================================================================
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import DEFAULT, AsyncMock, MagicMock, patch
 
 import pytest
 
 
+@pytest.fixture
+def fleet_mocks():
+    """Patch FleetManager's backends and status writes; yields the mocks by name."""
+    with patch.multiple(
+        "src.core.fleet",
+        init_db=DEFAULT,
+        Foundry=DEFAULT,
+        Architect=DEFAULT,
+        Publisher=DEFAULT,
+        PolicyGate=DEFAULT,
+        enqueue_mission_status=DEFAULT,
+        update_mission_status=DEFAULT,
+    ) as mocks:
+        yield mocks
+
+
+@pytest.fixture
+def fleet(fleet_mocks):
+    """A FleetManager on the mocked backends, closed after the test."""
+    from src.core.fleet import FleetManager
+
+    manager = FleetManager()
+    yield manager
+    manager.close()
+
+
 class TestFleetManagerClass:
     """Test FleetManager class."""
 
@@ -26,6 +52,29 @@ class TestFleetManagerClass:
         fleet = FleetManager()
         assert fleet is not None
 
+    def test_fleet_manager_close_stops_executor(self, fleet):
+        """close() should shut down the mission worker pool."""
+        from src.core.fleet import MAX_CONCURRENT_MISSIONS
+
+        assert fleet._executor._max_workers == MAX_CONCURRENT_MISSIONS
+
+        fleet.close()
+        with pytest.raises(RuntimeError):
+            fleet._executor.submit(lambda: None)
+
+    @pytest.mark.asyncio
+    async def test_schema_init_deferred_to_startup(self, fleet, fleet_mocks):
+        """The constructor shouldn't touch the DB; startup() runs init_db off the loop."""
+        import threading
+
+        fleet_mocks["init_db"].assert_not_called()
+
+        calling_threads = []
+        fleet_mocks["init_db"].side_effect = lambda: calling_threads.append(threading.get_ident())
+        await fleet.startup()
+
+        assert calling_threads and calling_threads[0] != threading.get_ident()
+
 
 class TestFleetConstants:
     """Test Fleet constants."""
@@ -50,6 +99,127 @@ class TestFleetConstants:
         # Should be a boolean
         assert isinstance(SKIP_PUBLISH, bool)
 
+    def test_extract_project_hint(self):
+        """_extract_project_hint strips prefixes/punctuation and drops generic hints."""
+        from src.core.fleet import _extract_project_hint
+
+        assert _extract_project_hint("What is the status of todo app?") == "todo app"
+        assert _extract_project_hint("How's the weather dashboard ?!") == "weather dashboard"
+        assert _extract_project_hint("how is IT?") is None
+
+    def test_elapsed_seconds(self):
+        """_elapsed_seconds handles Z-suffixed, naive and missing timestamps."""
+        from datetime import datetime, timedelta, timezone
+
+        from src.core.fleet import _elapsed_seconds
+
+        started = datetime.now(timezone.utc) - timedelta(seconds=90)
+        assert 89 <= _elapsed_seconds(started.isoformat().replace("+00:00", "Z")) <= 91
+        assert 89 <= _elapsed_seconds(started.replace(tzinfo=None).isoformat()) <= 91
+        assert _elapsed_seconds(None) is None
+        assert _elapsed_seconds("not a date") is None
+
+    def test_manifest_preview_is_bounded(self):
+        """Large manifests are trimmed to a few file heads before serialization."""
+        import json
+
+        from src.core import fleet
+
+        manifest = {
+            "project_name": "big-app",
+            "stack": "python",
+            "files": [{"path": f"f{i}.py", "content": "x" * 100_000} for i in range(200)],
+        }
+        preview = fleet._manifest_preview(manifest)
+
+        assert len(preview) <= fleet.MANIFEST_PREVIEW_MAX_CHARS
+        assert preview.startswith('{\n  "project_name": "big-app"')
+        small = {"project_name": "tiny", "files": [{"path": "a.py", "content": "print(1)"}]}
+        parsed = json.loads(fleet._manifest_preview(small))
+        assert parsed["files"] == [{"path": "a.py", "head": "print(1)"}]
+
+    @patch("src.core.fleet.console")
+    def test_info_lines_respect_quiet(self, mock_console):
+        """Routine lines are dropped under GANTRY_QUIET; the helper prints otherwise."""
+        from src.core import fleet
+
+        with patch("src.core.fleet.QUIET", True):
+            fleet._info("[cyan]routine[/cyan]")
+        mock_console.print.assert_not_called()
+
+        with patch("src.core.fleet.QUIET", False):
+            fleet._info("[cyan]routine[/cyan]")
+        mock_console.print.assert_called_once_with("[cyan]routine[/cyan]")
+
+    def test_save_design_image_streams_multi_chunk_payload(self, tmp_path):
+        """Design images larger than one decode chunk should round-trip byte for byte."""
+        import base64
+        import os
+
+        from src.core import fleet
+
+        payload = os.urandom(fleet._B64_CHUNK_CHARS)  # ~1.33 chunks once encoded
+        encoded = base64.encodebytes(payload).decode()  # line-wrapped every 76 chars
+        with patch("src.core.fleet.MISSIONS_DIR", tmp_path):
+            name = fleet._save_design_image(
+                "mission-img", f"data:image/png;base64,{encoded}", "mock.png"
+            )
+            bad = fleet._save_design_image("mission-bad", "iVBORw0KGgo=A", "mock.png")
+
+        assert name.endswith(".png")
+        assert (tmp_path / "mission-img" / name).read_bytes() == payload
+        assert bad is None
+        assert not any((tmp_path / "mission-bad").iterdir())
+
+    def test_save_design_image_reads_extension_from_data_url(self, tmp_path):
+        """The data URL's image subtype picks the extension; other headers fall back to png."""
+        from src.core import fleet
+
+        with patch("src.core.fleet.MISSIONS_DIR", tmp_path):
+            webp = fleet._save_design_image("m1", "data:image/WEBP;base64,AAAA", "x.bin")
+            odd = fleet._save_design_image("m2", "data:text/plain;base64,AAAA", "x.bin")
+            broken = fleet._save_design_image("m3", "data:image/png;base64", "x.png")
+
+        assert webp.endswith(".webp")
+        assert odd.endswith(".png")
+        assert broken is None
+
+    def test_intent_matchers(self):
+        """Clear/status intents should match any listed phrase, case-insensitively."""
+        from src.core.fleet import _is_clear_projects_intent, _is_status_query
+
+        assert _is_clear_projects_intent("Please CLEAR the projects list")
+        assert _is_clear_projects_intent("clear missions")
+        assert not _is_clear_projects_intent("build a clear todo app")
+        assert _is_status_query("How's my app?")
+        assert _is_status_query("is it finished yet")
+        assert not _is_status_query("build a todo app")
+
+    def test_classify_build_errors(self):
+        """_classify maps healable build errors to a policy and leaves others alone."""
+        from src.core.deployer import DeploymentError
+        from src.core.fleet import _classify
+        from src.core.foundry import AuditFailedError, BuildTimeoutError
+
+        label, build_context = _classify(AuditFailedError("audit", 1, "npm ERR!"))
+        assert label == "Audit"
+        assert build_context(AuditFailedError("audit", 1, "npm ERR!")) == "npm ERR!"
+        assert _classify(DeploymentError("vercel 500"))[0] == "Deploy"
+        assert _classify(BuildTimeoutError("too slow")) is None
+
+    def test_classify_mission_failures(self):
+        """MISSION_FAILURES maps mission-ending errors to their final status."""
+        from src.core.fleet import MISSION_FAILURES, BuildTimeoutError, _classify
+        from src.core.policy import SecurityViolation
+        from src.core.reliability import CircuitOpenError
+
+        assert _classify(BuildTimeoutError("slow"), MISSION_FAILURES)[0] == "TIMEOUT"
+        assert _classify(SecurityViolation("no", "rule"), MISSION_FAILURES)[0] == "BLOCKED"
+        status, speech = _classify(CircuitOpenError("Foundry is down"), MISSION_FAILURES)
+        assert status == "UPSTREAM_DOWN"
+        assert speech(CircuitOpenError("Foundry is down")).startswith("Foundry is down")
+        assert _classify(RuntimeError("boom"), MISSION_FAILURES) is None
+
 
 class TestAsyncProgressTracker:
     """Test AsyncProgressTracker class."""
@@ -79,6 +249,7 @@ class TestAsyncProgressTracker:
         tracker = AsyncProgressTracker("test-mission-123", "BUILDING")
         assert tracker.mission_id == "test-mission-123"
         assert tracker.phase == "BUILDING"
+        assert not hasattr(tracker, "__dict__")  # slotted
 
     @patch("src.core.fleet.init_db")
     @patch("src.core.fleet.update_mission_status")
@@ -90,6 +261,71 @@ class TestAsyncProgressTracker:
         async with AsyncProgressTracker("test-mission-123", "BUILDING") as tracker:
             assert tracker is not None
 
+    @patch("src.core.fleet.init_db")
+    @patch("src.core.fleet.update_mission_status")
+    def test_async_progress_tracker_update_phase(self, mock_update, mock_init_db):
+        """update_phase should switch phase in place and allow pausing."""
+        from src.core.fleet import AsyncProgressTracker
+
+        tracker = AsyncProgressTracker("test-mission-123", "ARCHITECTING")
+        tracker.update_phase("BUILDING")
+        assert tracker.phase == "BUILDING"
+
+        tracker.update_phase(None)
+        assert tracker.phase is None
+
+    @patch("src.core.fleet.init_db")
+    @patch("src.core.fleet.PROGRESS_UPDATE_SECONDS", 0.01)
+    @patch("src.core.fleet.enqueue_mission_status")
+    @pytest.mark.asyncio
+    async def test_async_progress_trackers_share_one_ticker(self, mock_enqueue, mock_init_db):
+        """Active trackers share one ticker task, cancelled when the last one stops."""
+        import asyncio
+
+        from src.core.fleet import AsyncProgressTracker
+
+        first = AsyncProgressTracker("mission-a", "BUILDING").start()
+        second = AsyncProgressTracker("mission-b", "ARCHITECTING").start()
+        ticker = AsyncProgressTracker._ticker
+        await asyncio.sleep(0.05)
+        await first.stop()
+        assert not ticker.done()
+        await second.stop()
+        await asyncio.sleep(0)
+
+        assert ticker.done()
+
+        assert {c[0][0] for c in mock_enqueue.call_args_list} == {"mission-a", "mission-b"}
+        assert AsyncProgressTracker._active == {}
+
+    @patch("src.core.fleet.init_db")
+    @patch("src.core.fleet.PROGRESS_UPDATE_SECONDS", 0.01)
+    @patch("src.core.fleet.enqueue_mission_status")
+    @pytest.mark.asyncio
+    async def test_ticker_broadcasts_missions_concurrently(self, mock_enqueue, mock_init_db):
+        """A slow WebSocket client shouldn't delay other missions' progress broadcasts."""
+        import asyncio
+
+        from src.core.fleet import AsyncProgressTracker
+
+        fast_sent = asyncio.Event()
+
+        async def broadcast(mission_id, message):
+            if mission_id == "mission-slow":
+                await asyncio.sleep(10)
+            else:
+                fast_sent.set()
+
+        ws = MagicMock()
+        ws.broadcast = broadcast
+        slow = AsyncProgressTracker("mission-slow", "BUILDING", ws).start()
+        fast = AsyncProgressTracker("mission-fast", "BUILDING", ws).start()
+        try:
+            await asyncio.wait_for(fast_sent.wait(), timeout=1)
+        finally:
+            await slow.stop()
+            await fast.stop()
+
 
 class TestFleetMethods:
     """Test FleetManager methods."""
@@ -152,6 +388,421 @@ class TestFleetMethods:
         assert hasattr(fleet, "process_voice_input")
         assert callable(fleet.process_voice_input)
 
+    def test_publisher_config_is_cached_until_refresh(self, fleet_mocks):
+        """is_configured() should be read at init and again only on refresh."""
+        from src.core.fleet import FleetManager
+
+        fleet_mocks["Publisher"].return_value.is_configured.return_value = False
+        fleet = FleetManager()
+        assert fleet._publisher_configured is False
+
+        fleet_mocks["Publisher"].return_value.is_configured.return_value = True
+        assert fleet._publisher_configured is False
+        assert fleet.refresh_publisher_config() is True
+        assert fleet._publisher_configured is True
+        fleet.close()
+
+    @patch("src.core.fleet.flush_mission_statuses")
+    @pytest.mark.asyncio
+    async def test_final_status_written_off_the_event_loop(self, mock_flush, fleet, fleet_mocks):
+        """Resting statuses flush then write in a worker thread, not on the loop."""
+        import threading
+
+        writer_threads = []
+        mock_update = fleet_mocks["update_mission_status"]
+        mock_update.side_effect = lambda *a: writer_threads.append(threading.current_thread())
+
+        await fleet._update_status("mission-a", "FAILED", "Boom.")
+
+        mock_flush.assert_called_once()
+        mock_update.assert_called_once_with("mission-a", "FAILED", "Boom.")
+        assert writer_threads[0] is not threading.main_thread()
+
+    def test_friendly_error_uses_table_order(self, fleet):
+        """The first listed pattern wins, wherever it appears in the message."""
+        assert fleet._get_friendly_error("Connection TIMEOUT").startswith("Request timed out")
+        assert fleet._get_friendly_error("API Error 429").startswith("Rate limited")
+        assert fleet._get_friendly_error("All 3 tiers failed").startswith("All AI models")
+        assert fleet._get_friendly_error("x" * 200).endswith("...")
+
+    @pytest.mark.asyncio
+    async def test_set_max_concurrent_admits_waiting_missions(self, fleet):
+        """Raising the cap should admit a queued mission without waiting for a slot."""
+        import asyncio
+
+        await fleet.set_max_concurrent(1)
+        release = asyncio.Event()
+        admitted = []
+
+        async def mission(name):
+            async with fleet._mission_slot():
+                admitted.append(name)
+                await release.wait()
+
+        tasks = [asyncio.create_task(mission(n)) for n in ("a", "b")]
+        await asyncio.sleep(0.01)
+        assert admitted == ["a"]
+
+        await fleet.set_max_concurrent(2)
+        await asyncio.sleep(0.01)
+        assert admitted == ["a", "b"]
+        assert fleet._running_missions == 2
+
+        release.set()
+        await asyncio.gather(*tasks)
+        assert fleet._running_missions == 0
+        with pytest.raises(ValueError):
+            await fleet.set_max_concurrent(0)
+
+    @pytest.mark.asyncio
+    async def test_broadcast_coalesces_rapid_transitions(self, fleet_mocks):
+        """Back-to-back status changes should reach clients as one frame per mission."""
+        import asyncio
+
+        from src.core.fleet import FleetManager
+
+        ws = MagicMock()
+        ws.broadcast = AsyncMock()
+        fleet = FleetManager(ws_manager=ws)
+
+        for status in ("ARCHITECTING", "VALIDATING", "BUILDING"):
+            await fleet._broadcast("mission-a", status, status.title())
+        await fleet._broadcast("mission-b", "HEALING", "Self-repair.")
+        await asyncio.sleep(0.1)
+
+        sent = {c[0][0]: c[0][1]["status"] for c in ws.broadcast.await_args_list}
+        assert ws.broadcast.await_count == 2
+        assert sent == {"mission-a": "BUILDING", "mission-b": "HEALING"}
+
+        await fleet._broadcast("mission-a", "DEPLOYED", "Live.")  # new window, new drain
+        await asyncio.sleep(0.1)
+        assert ws.broadcast.await_args[0][1]["status"] == "DEPLOYED"
+        fleet.close()
+
+    @pytest.mark.asyncio
+    async def test_status_frame_carries_render_context(self, fleet_mocks):
+        """Status frames should include the stage label and any extra context."""
+        import asyncio
+
+        from src.core.fleet import FleetManager
+
+        ws = MagicMock()
+        ws.broadcast = AsyncMock()
+        fleet = FleetManager(ws_manager=ws)
+
+        await fleet._update_status(
+            "mission-a", "BUILDING", "Attempt 2.", {"attempt": 2, "project_name": "todo"}
+        )
+        await asyncio.sleep(0.1)
+
+        frame = ws.broadcast.await_args[0][1]
+        assert frame["stage"] == "Building and running tests"
+        assert frame["terminal"] is False
+        assert frame["attempt"] == 2
+        assert frame["project_name"] == "todo"
+        fleet_mocks["enqueue_mission_status"].assert_called_once_with(
+            "mission-a", "BUILDING", "Attempt 2."
+        )
+        fleet.close()
+
+    @pytest.mark.asyncio
+    async def test_list_active_tracks_spawned_missions(self, fleet):
+        """Spawned mission tasks should be listed until they finish."""
+        import asyncio
+
+        release = asyncio.Event()
+        task = fleet._spawn_mission("mission-a", release.wait())
+        assert fleet.list_active() == ["mission-a"]
+
+        release.set()
+        await task
+        await asyncio.sleep(0)
+        assert fleet.list_active() == []
+
+    @pytest.mark.asyncio
+    async def test_cancel_missions_marks_running_mission_failed(self, fleet, fleet_mocks):
+        """cancel_missions should cancel pipelines and leave them FAILED, not mid-phase."""
+        import asyncio
+
+        async def _stall(*args):
+            await asyncio.sleep(10)
+
+        fleet._phase_validate = _stall
+        fleet._spawn_mission(
+            "mission-a",
+            fleet._run_mission_with_target("mission-a", "Build a todo app", None, True, False),
+        )
+        await asyncio.sleep(0.05)
+
+        assert await fleet.cancel_missions() == 1
+        await asyncio.sleep(0)
+
+        assert fleet.list_active() == []
+        fleet_mocks["update_mission_status"].assert_called_with(
+            "mission-a", "FAILED", "Mission cancelled."
+        )
+
+    @patch("src.core.fleet.create_mission")
+    @pytest.mark.asyncio
+    async def test_shutdown_drains_then_refuses_new_missions(self, mock_create, fleet):
+        """shutdown should let a quick mission finish, cancel a stuck one, then refuse work."""
+        import asyncio
+
+        quick = fleet._spawn_mission("mission-a", asyncio.sleep(0.01))
+        stuck = fleet._spawn_mission("mission-b", asyncio.sleep(10))
+
+        assert await fleet.shutdown(timeout=0.1) == 1
+        assert quick.done() and not quick.cancelled()
+        assert stuck.cancelled()
+
+        with pytest.raises(RuntimeError):
+            await fleet.dispatch_mission("Build a todo app")
+        mock_create.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_abort_mission_cancels_only_that_mission(self, fleet, fleet_mocks):
+        """abort_mission should cancel one pipeline by id and leave the others running."""
+        import asyncio
+
+        async def _stall(*args):
+            await asyncio.sleep(10)
+
+        fleet._phase_validate = _stall
+        for mid in ("mission-a", "mission-b"):
+            fleet._spawn_mission(
+                mid, fleet._run_mission_with_target(mid, "Build a todo app", None, True, False)
+            )
+        await asyncio.sleep(0.05)
+
+        assert await fleet.abort_mission("mission-a") is True
+        assert await fleet.abort_mission("mission-zzz") is False
+        await asyncio.sleep(0)
+
+        assert fleet.list_active() == ["mission-b"]
+        fleet_mocks["update_mission_status"].assert_called_with(
+            "mission-a", "FAILED", "Mission cancelled."
+        )
+        await fleet.cancel_missions()
+
+    @pytest.mark.asyncio
+    async def test_abort_mission_while_queued_for_a_slot(self, fleet, fleet_mocks):
+        """A mission aborted before it got a slot should end FAILED, not stay PENDING."""
+        import asyncio
+
+        async def _stall(*args):
+            await asyncio.sleep(10)
+
+        await fleet.set_max_concurrent(1)
+        fleet._phase_validate = _stall
+        for mid in ("mission-a", "mission-b"):
+            fleet._spawn_mission(
+                mid, fleet._run_mission_with_target(mid, "Build a todo app", None, True, False)
+            )
+        await asyncio.sleep(0.05)
+
+        # mission-a holds the only slot; mission-b is still waiting for it
+        assert await fleet.abort_mission("mission-b") is True
+
+        fleet_mocks["update_mission_status"].assert_called_with(
+            "mission-b", "FAILED", "Mission cancelled."
+        )
+        assert fleet.list_active() == ["mission-a"]
+        await fleet.cancel_missions()
+
+    @patch("src.core.fleet.console")
+    @pytest.mark.asyncio
+    async def test_spawned_mission_crash_is_reported(self, mock_console, fleet):
+        """An exception escaping a mission task should be printed, not lost."""
+        import asyncio
+
+        async def _crash():
+            raise RuntimeError("db went away")
+
+        task = fleet._spawn_mission("mission-crash", _crash())
+        assert task.get_name() == "mission-mission-"
+        await asyncio.gather(task, return_exceptions=True)
+        await asyncio.sleep(0)
+
+        assert fleet.list_active() == []
+        printed = " ".join(str(c[0][0]) for c in mock_console.print.call_args_list)
+        assert "mission-" in printed
+        assert "RuntimeError: db went away" in printed
+
+    @pytest.mark.asyncio
+    async def test_try_build_streams_foundry_steps(self, fleet_mocks):
+        """Steps reported from the build thread should reach clients before it returns."""
+        from src.core.fleet import FleetManager
+
+        ws = MagicMock()
+        ws.broadcast = AsyncMock()
+        fleet = FleetManager(ws_manager=ws)
+
+        def _build(_manifest, _mission_id, deploy, progress):
+            progress("Copying 3 files")
+            progress("Running tests")
+            return "built"
+
+        fleet._foundry.build = _build
+
+        assert await fleet._try_build(MagicMock(), "mission-a", True) == "built"
+        frames = [c[0][1] for c in ws.broadcast.await_args_list]
+        assert [f["step"] for f in frames] == ["Copying 3 files", "Running tests"]
+        assert {f["type"] for f in frames} == {"progress"}
+        fleet.close()
+
+    @patch("src.core.fleet.random.uniform", return_value=0)
+    @pytest.mark.asyncio
+    async def test_phase_build_heals_then_retries(self, mock_uniform, fleet, fleet_mocks):
+        """A failed audit should heal the manifest and retry the build with it."""
+        import time
+
+        from src.core.fleet import AsyncProgressTracker
+        from src.core.foundry import AuditFailedError
+
+        tracker = AsyncProgressTracker("mission-a", None)
+        healed = MagicMock()
+        heal_phases = []
+
+        def _heal(*_args):
+            heal_phases.append(tracker.phase)
+            return healed
+
+        fleet_mocks["Architect"].return_value.heal_blueprint.side_effect = _heal
+        fleet._try_build = AsyncMock(side_effect=[AuditFailedError("audit", 1, "boom"), "ok"])
+
+        result = await fleet._phase_build(
+            "mission-a",
+            MagicMock(),
+            False,
+            time.monotonic() + 60,
+            tracker=tracker,
+            tag="[Mission mission-]",
+        )
+
+        assert result == "ok"
+        assert fleet._try_build.call_args_list[1][0][0] is healed
+        assert heal_phases == ["HEALING"]
+        assert tracker.phase is None
+
+    @pytest.mark.asyncio
+    async def test_phase_build_skips_healing_on_config_errors(self, fleet, fleet_mocks):
+        """A deploy that fails on credentials should fail once instead of healing."""
+        import time
+
+        from src.core.deployer import DeploymentError
+        from src.core.fleet import AsyncProgressTracker
+
+        fleet._try_build = AsyncMock(side_effect=DeploymentError("VERCEL_TOKEN not configured"))
+
+        result = await fleet._phase_build(
+            "mission-a",
+            MagicMock(),
+            True,
+            time.monotonic() + 60,
+            tracker=AsyncProgressTracker("mission-a", None),
+            tag="[Mission mission-]",
+        )
+
+        assert result is None
+        fleet._try_build.assert_awaited_once()
+        fleet_mocks["Architect"].return_value.heal_blueprint.assert_not_called()
+        assert fleet_mocks["update_mission_status"].call_args[0][1] == "FAILED"
+
+    @patch("src.core.fleet.finalize_mission")
+    @pytest.mark.asyncio
+    async def test_run_mission_happy_path_deploys(self, mock_finalize, fleet):
+        """A first-try build should go straight to the DEPLOYED final status."""
+
+        fleet._try_build = AsyncMock(return_value=MagicMock(deploy_url="https://app.example"))
+        fleet._phase_publish = AsyncMock()
+
+        await fleet._run_mission_with_target("mission-a", "Build a todo app", None, True, False)
+
+        fleet._try_build.assert_awaited_once()
+        fleet._phase_publish.assert_not_awaited()  # publish=False skips the phase entirely
+        mock_finalize.assert_called_once_with(
+            "mission-a",
+            status="DEPLOYED",
+            speech="Live at https://app.example",
+            deploy_url="https://app.example",
+            pr_url=None,
+        )
+
+    @pytest.mark.asyncio
+    async def test_trademark_refusal_suggests_inspired_rewrite(self, fleet, fleet_mocks):
+        """A brand refusal should ask for input and name the first matching brand."""
+        from src.core.architect import ArchitectError
+
+        fleet_mocks["Architect"].return_value.draft_blueprint.side_effect = ArchitectError(
+            "Cannot replicate Copyrighted design"
+        )
+
+        await fleet._run_mission_with_target("mission-a", "Clone the Tesla site", None, True, False)
+
+        _mission_id, status, speech = fleet_mocks["update_mission_status"].call_args[0]
+        assert status == "AWAITING_INPUT"
+        assert "Tesla" in speech
+
+    @pytest.mark.asyncio
+    async def test_run_mission_stops_after_policy_block(self, fleet, fleet_mocks):
+        """A policy violation should leave the mission BLOCKED and never build."""
+
+        from src.core.policy import SecurityViolation
+
+        fleet_mocks["PolicyGate"].return_value.validate.side_effect = SecurityViolation(
+            "forbidden", "forbidden_patterns"
+        )
+        fleet._try_build = AsyncMock()
+
+        await fleet._run_mission_with_target("mission-a", "Build a miner", None, True, False)
+
+        fleet._try_build.assert_not_awaited()
+        assert fleet_mocks["update_mission_status"].call_args[0][:2] == ("mission-a", "BLOCKED")
+
+    @pytest.mark.asyncio
+    async def test_phase_build_fails_fast_without_budget(self, fleet):
+        """No build should start when less than MIN_BUILD_BUDGET_SEC remains."""
+        import time
+
+        from src.core.fleet import AsyncProgressTracker
+        from src.core.foundry import BuildTimeoutError
+
+        fleet._try_build = AsyncMock()
+
+        with pytest.raises(BuildTimeoutError):
+            await fleet._phase_build(
+                "mission-a",
+                MagicMock(),
+                False,
+                time.monotonic() + 1,
+                tracker=AsyncProgressTracker("mission-a", None),
+                tag="[Mission mission-]",
+            )
+
+        fleet._try_build.assert_not_awaited()
+
+    @patch("src.core.fleet.list_missions")
+    @patch("src.core.fleet.find_missions_by_status")
+    def test_status_query_asks_db_for_active_build(self, mock_by_status, mock_list, fleet):
+        """Without a hint, the active build comes from a status-filtered query."""
+        from src.core.db import MissionRecord
+        from src.core.fleet import IN_PROGRESS_STATUSES
+
+        active = MissionRecord(id="m-1", prompt="todo app", status="HEALING", created_at="")
+        mock_by_status.return_value = [active]
+
+        result = fleet._handle_status_query("How is it?")
+
+        mock_by_status.assert_called_once_with(IN_PROGRESS_STATUSES, limit=1)
+        mock_list.assert_not_called()
+        assert result["mission_id"] == "m-1"
+        assert result["speech"] == 'Building "todo app": Self-healing (fixing issues).'
+
+        mock_by_status.return_value = []
+        mock_list.return_value = []
+        assert fleet._handle_status_query("How is it?")["mission_id"] is None
+        mock_list.assert_called_once_with(limit=1)
+
 
 class TestFleetDispatch:
     """Test dispatch_mission behavior."""
@@ -164,13 +815,7 @@ class TestFleetDispatch:
     @patch("src.core.fleet.create_mission")
     @pytest.mark.asyncio
     async def test_dispatch_creates_mission(
-        self,
-        mock_create,
-        mock_policy,
-        mock_pub,
-        mock_arch,
-        mock_foundry,
-        mock_init_db,
+        self, mock_create, mock_policy, mock_pub, mock_arch, mock_foundry, mock_init_db
     ):
         """dispatch_mission should create DB mission."""
         from src.core.fleet import FleetManager
@@ -179,10 +824,8 @@ class TestFleetDispatch:
 
         fleet = FleetManager()
 
-        with patch("asyncio.create_task") as mock_create_task:
-            mock_task = MagicMock()
-            mock_create_task.return_value = mock_task
-
+        # Close the pipeline coroutine instead of running it
+        with patch.object(fleet, "_spawn_mission", side_effect=lambda _mid, coro: coro.close()):
             mission_id = await fleet.dispatch_mission("Build an app")
 
             mock_create.assert_called_once()
@@ -196,13 +839,7 @@ class TestFleetDispatch:
     @patch("src.core.fleet.create_mission")
     @pytest.mark.asyncio
     async def test_dispatch_with_deploy_false(
-        self,
-        mock_create,
-        mock_policy,
-        mock_pub,
-        mock_arch,
-        mock_foundry,
-        mock_init_db,
+        self, mock_create, mock_policy, mock_pub, mock_arch, mock_foundry, mock_init_db
     ):
         """dispatch_mission should respect deploy=False."""
         from src.core.fleet import FleetManager
@@ -211,10 +848,8 @@ class TestFleetDispatch:
 
         fleet = FleetManager()
 
-        with patch("asyncio.create_task") as mock_create_task:
-            mock_task = MagicMock()
-            mock_create_task.return_value = mock_task
-
+        # Close the pipeline coroutine instead of running it
+        with patch.object(fleet, "_spawn_mission", side_effect=lambda _mid, coro: coro.close()):
             result = await fleet.dispatch_mission("Build an app", deploy=False)
 
             assert result == "test-uuid-123"
@@ -227,13 +862,7 @@ class TestFleetDispatch:
     @patch("src.core.fleet.create_mission")
     @pytest.mark.asyncio
     async def test_dispatch_with_publish_false(
-        self,
-        mock_create,
-        mock_policy,
-        mock_pub,
-        mock_arch,
-        mock_foundry,
-        mock_init_db,
+        self, mock_create, mock_policy, mock_pub, mock_arch, mock_foundry, mock_init_db
     ):
         """dispatch_mission should respect publish=False."""
         from src.core.fleet import FleetManager
@@ -242,10 +871,8 @@ class TestFleetDispatch:
 
         fleet = FleetManager()
 
-        with patch("asyncio.create_task") as mock_create_task:
-            mock_task = MagicMock()
-            mock_create_task.return_value = mock_task
-
+        # Close the pipeline coroutine instead of running it
+        with patch.object(fleet, "_spawn_mission", side_effect=lambda _mid, coro: coro.close()):
             result = await fleet.dispatch_mission("Build an app", publish=False)
 
             assert result == "test-uuid-123"
@@ -281,3 +908,24 @@ class TestConsultationFlow:
 
         fleet = FleetManager()
         assert hasattr(fleet, "_continue_consultation")
+
+    @patch("src.core.fleet.create_consultation", return_value="test-uuid-123")
+    @pytest.mark.asyncio
+    async def test_consultant_analysis_runs_off_event_loop(self, mock_create, fleet):
+        """The consultant's blocking LLM call should not run on the loop thread."""
+        import threading
+
+        loop_thread = threading.get_ident()
+        analyze_threads = []
+
+        def _analyze(_conversation):
+            analyze_threads.append(threading.get_ident())
+            return MagicMock(design_target=None)
+
+        fleet._consultant = MagicMock(analyze=_analyze)
+        fleet._handle_consultant_response = AsyncMock(return_value={"status": "AWAITING_INPUT"})
+
+        result = await fleet._start_consultation("A todo app", True, True, None, None)
+
+        assert result == {"status": "AWAITING_INPUT"}
+        assert analyze_threads and analyze_threads[0] != loop_thread
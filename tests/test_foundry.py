@@ -131,6 +131,52 @@ class TestBlackBox:
 
         assert hasattr(BlackBox, "log")
 
+    def test_blackbox_writes_indented_evidence(self, tmp_path):
+        """Evidence files should be indented JSON that reads back unchanged."""
+        import json
+
+        from src.core.foundry import BlackBox
+
+        with patch("src.core.foundry.MISSIONS_DIR", tmp_path):
+            box = BlackBox("mission-a")
+            box.save_audit_fail(2, "boom\n")
+            box.finalize()
+
+        report = (tmp_path / "mission-a" / "audit_fail.json").read_text()
+        assert report.startswith('{\n  "timestamp"')
+        assert json.loads(report)["output"] == "boom\n"
+        lines = (tmp_path / "mission-a" / "flight_recorder.jsonl").read_text().splitlines()
+        assert [json.loads(line)["event"] for line in lines] == ["AUDIT_FAILED"]
+
+    def test_blackbox_events_reach_disk_before_finalize(self, tmp_path):
+        """Each event should be on disk as soon as it is logged, not only at finalize."""
+        import json
+
+        from src.core.foundry import BlackBox
+
+        with patch("src.core.foundry.MISSIONS_DIR", tmp_path):
+            box = BlackBox("mission-a")
+            box.log("POD_INIT")
+            recorder = tmp_path / "mission-a" / "flight_recorder.jsonl"
+            assert json.loads(recorder.read_text())["event"] == "POD_INIT"
+            box.finalize()
+
+    def test_blackbox_log_after_finalize_appends(self, tmp_path):
+        """Logging after finalize (a failed cleanup) should append, not hit a closed file."""
+        import json
+
+        from src.core.foundry import BlackBox
+
+        with patch("src.core.foundry.MISSIONS_DIR", tmp_path):
+            box = BlackBox("mission-a")
+            box.log("BUILD_FAILED")
+            box.finalize()
+            box.log("BUILD_ERROR", "container.remove failed")
+            box.finalize()
+
+        lines = (tmp_path / "mission-a" / "flight_recorder.jsonl").read_text().splitlines()
+        assert [json.loads(line)["event"] for line in lines] == ["BUILD_FAILED", "BUILD_ERROR"]
+
 
 class TestFoundryMethods:
     """Test Foundry methods with mocking."""
@@ -146,6 +192,52 @@ class TestFoundryMethods:
         foundry = Foundry()
         assert foundry is not None
 
+    def test_create_tar_round_trips_files(self):
+        """The injected archive should hold every manifest file, UTF-8 encoded."""
+        import io
+        import tarfile
+
+        from src.core.foundry import Foundry
+        from src.domain.models import FileSpec, GantryManifest, StackType
+
+        manifest = GantryManifest(
+            project_name="TarApp",
+            stack=StackType.NODE,
+            files=[
+                FileSpec(path="index.js", content="console.log('héllo');"),
+                FileSpec(path="src/util.js", content="export const x = 1;"),
+            ],
+            audit_command="node index.js",
+            run_command="node index.js",
+        )
+
+        with patch.object(Foundry, "__init__", lambda self: None):
+            data = Foundry()._create_tar(manifest)
+
+        with tarfile.open(fileobj=io.BytesIO(data)) as tar:
+            assert tar.getnames() == ["index.js", "src/util.js"]
+            assert tar.extractfile("index.js").read().decode() == "console.log('héllo');"
+
+    def test_design_image_tar_places_image_under_public(self, tmp_path):
+        """The design reference should be archived as public/<name> with its bytes intact."""
+        import io
+        import tarfile
+
+        from src.core.foundry import Foundry
+
+        (tmp_path / "design-reference.png").write_bytes(b"\x89PNG fake image")
+
+        with patch.object(Foundry, "__init__", lambda self: None):
+            foundry = Foundry()
+            data = foundry._create_design_image_tar(tmp_path, "design-reference.png")
+            assert foundry._create_design_image_tar(tmp_path, "missing.png") is None
+            (tmp_path / "empty.png").touch()
+            assert foundry._create_design_image_tar(tmp_path, "empty.png") is None
+
+        with tarfile.open(fileobj=io.BytesIO(data)) as tar:
+            member = tar.extractfile("public/design-reference.png")
+            assert member.read() == b"\x89PNG fake image"
+
     def test_foundry_has_attributes(self):
         """Foundry should have required attributes."""
         from src.core.foundry import Foundry
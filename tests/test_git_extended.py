@@ -5,8 +5,6 @@
 # =============================================================================
 
 
-
-
 class TestGitProvider:
     """Test GitProvider class."""
 
@@ -107,6 +105,24 @@ class TestGitHubFunctions:
         assert "username" in params
         assert "repo_name" in params
 
+    def test_github_calls_reuse_given_session(self):
+        """A caller's pooled session should carry both API calls."""
+        from unittest.mock import MagicMock, patch
+
+        from src.infra.git_client import create_github_repo, create_pull_request
+
+        session = MagicMock()
+        session.post.return_value = MagicMock(
+            status_code=201, json=lambda: {"clone_url": "c", "html_url": "h", "number": 1}
+        )
+
+        with patch("src.infra.git_client.requests.post") as one_off:
+            create_github_repo("token", "repo", session=session)
+            create_pull_request("token", "user", "repo", "feat/x", "t", "b", session=session)
+
+        one_off.assert_not_called()
+        assert session.post.call_count == 2
+
 
 class TestGitProviderInit:
     """Test GitProvider initialization."""
@@ -225,3 +225,68 @@ class TestFleetManager:
         from src.core.fleet import FleetManager
 
         assert FleetManager is not None
+
+
+class TestConnectionManager:
+    """Test WebSocket broadcast fan-out."""
+
+    async def test_broadcast_serializes_once_for_all_watchers(self):
+        """Every watcher gets the same pre-encoded text; a dead socket doesn't stop the rest."""
+        from unittest.mock import AsyncMock
+
+        from src.main_fastapi import ConnectionManager
+
+        manager = ConnectionManager()
+        dead, alive = AsyncMock(), AsyncMock()
+        dead.send_text.side_effect = RuntimeError("closed")
+        manager.active_connections["mission-a"] = [dead, alive]
+
+        await manager.broadcast("mission-a", {"type": "progress", "phase": "BUILDING"})
+        await manager.broadcast("mission-b", {"type": "progress"})  # no watchers
+
+        alive.send_text.assert_awaited_once_with('{"type":"progress","phase":"BUILDING"}')
+
+    async def test_broadcast_writes_to_watchers_concurrently(self):
+        """A slow watcher shouldn't hold up delivery to the others."""
+        import asyncio
+        from unittest.mock import AsyncMock
+
+        from src.main_fastapi import ConnectionManager
+
+        manager = ConnectionManager()
+        release = asyncio.Event()
+        slow, fast = AsyncMock(), AsyncMock()
+
+        async def _stall(_payload):
+            await release.wait()
+
+        slow.send_text.side_effect = _stall
+        manager.active_connections["mission-a"] = [slow, fast]
+
+        task = asyncio.create_task(manager.broadcast("mission-a", {"type": "status"}))
+        await asyncio.sleep(0.01)
+        fast.send_text.assert_awaited_once_with('{"type":"status"}')
+        assert not task.done()
+
+        release.set()
+        await task
+
+
+class TestMissionFailureEndpoint:
+    """Test /gantry/missions/{id}/failure evidence reads."""
+
+    async def test_partial_flight_recorder_line_is_skipped(self, tmp_path):
+        """A build killed mid-write still returns every complete event."""
+        from src.main_fastapi import get_mission_failure
+
+        folder = tmp_path / "missions" / "mission-a"
+        folder.mkdir(parents=True)
+        (folder / "flight_recorder.jsonl").write_text(
+            '{"event": "POD_INIT"}\n{"event": "AUDIT_STARTED"}\n{"event": "AUD'
+        )
+
+        with patch("src.main_fastapi.PROJECT_ROOT", tmp_path):
+            result = await get_mission_failure("mission-a", "user")
+
+        assert result["failure"] == [{"event": "POD_INIT"}, {"event": "AUDIT_STARTED"}]
+        assert result["speech"] == "Flight recording available."
@@ -49,6 +49,52 @@ class TestPolicyGate:
             policy_gate.validate(manifest)
         assert "evil.py" in str(exc_info.value)
 
+    def test_forbidden_pattern_match_ignores_case_and_names_pattern(self, tmp_path):
+        """Compiled patterns should stay case-insensitive and report their source text."""
+        policy_file = tmp_path / "policy.yaml"
+        policy_file.write_text("allowed_stacks: [python]\nforbidden_patterns: ['rm -rf', 'mkfs']\n")
+        manifest = GantryManifest(
+            project_name="WipeApp",
+            stack=StackType.PYTHON,
+            files=[FileSpec(path="wipe.py", content="cmd = 'MKFS /dev/sda'")],
+            audit_command="python wipe.py",
+            run_command="python wipe.py",
+        )
+        with pytest.raises(SecurityViolation) as exc_info:
+            PolicyGate(policy_file).validate(manifest)
+        assert exc_info.value.details == "Pattern: mkfs"
+
+    def test_str_only_pattern_falls_back_to_str_scan(self, tmp_path):
+        """ASCII patterns that only compile as str (e.g. \\u escapes) still load and match."""
+        policy_file = tmp_path / "policy.yaml"
+        policy_file.write_text(
+            "allowed_stacks: [python]\nforbidden_patterns: ['caf\\u00e9', '(?u)mkfs']\n"
+        )
+        gate = PolicyGate(policy_file)
+        manifest = GantryManifest(
+            project_name="WipeApp",
+            stack=StackType.PYTHON,
+            files=[FileSpec(path="wipe.py", content="cmd = 'mkfs /dev/sda'")],
+            audit_command="python wipe.py",
+            run_command="python wipe.py",
+        )
+        with pytest.raises(SecurityViolation) as exc_info:
+            gate.validate(manifest)
+        assert exc_info.value.details == "Pattern: (?u)mkfs"
+
+    def test_forbidden_pattern_found_in_non_ascii_file(self, policy_gate):
+        """Files with non-ASCII text should still be scanned (str path, not bytes)."""
+        manifest = GantryManifest(
+            project_name="CafeApp",
+            stack=StackType.PYTHON,
+            files=[FileSpec(path="café.py", content="# café ☕\nimport os\nos.system('ls')")],
+            audit_command="python café.py",
+            run_command="python café.py",
+        )
+        with pytest.raises(SecurityViolation) as exc_info:
+            policy_gate.validate(manifest)
+        assert "café.py" in str(exc_info.value)
+
     def test_forbidden_pattern_os_system_fails(self, policy_gate):
         """Test that os.system() usage is caught."""
         manifest = GantryManifest(
@@ -0,0 +1,77 @@
+"""
+Tests for the per-backend circuit breaker.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from src.core.reliability import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError
+
+
+def _boom():
+    raise RuntimeError("backend down")
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker state transitions."""
+
+    def test_passes_calls_through_when_closed(self):
+        """A closed breaker should return the wrapped call's result."""
+        breaker = CircuitBreaker("test")
+
+        assert breaker.call(lambda x: x * 2, 21) == 42
+        assert breaker.state == CLOSED
+
+    def test_opens_after_threshold_and_rejects(self):
+        """Consecutive failures should open the breaker and short-circuit calls."""
+        breaker = CircuitBreaker("test", failure_threshold=2)
+
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                breaker.call(_boom)
+
+        assert breaker.state == OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.call(lambda: "never called")
+
+    def test_half_open_probe_closes_on_success(self):
+        """After recovery_timeout a single probe should close the breaker."""
+        breaker = CircuitBreaker("test", failure_threshold=1, recovery_timeout=10)
+        with pytest.raises(RuntimeError):
+            breaker.call(_boom)
+
+        with patch("src.core.reliability.time.monotonic", return_value=10**9):
+            assert breaker.state == HALF_OPEN
+            assert breaker.call(lambda: "ok") == "ok"
+
+        assert breaker.state == CLOSED
+
+    def test_ignored_exceptions_do_not_trip(self):
+        """Exceptions in ignore should propagate without counting as failures."""
+        breaker = CircuitBreaker("test", failure_threshold=1, ignore=(ValueError,))
+
+        def _bad_input():
+            raise ValueError("audit failed")
+
+        with pytest.raises(ValueError):
+            breaker.call(_bad_input)
+
+        assert breaker.state == CLOSED
+
+    def test_trip_on_counts_only_listed_exceptions(self):
+        """With trip_on, other errors are answers and only listed ones trip."""
+        breaker = CircuitBreaker("test", failure_threshold=1, trip_on=(ConnectionError,))
+
+        def _refused():
+            raise ValueError("content refused")
+
+        def _down():
+            raise ConnectionError("unreachable")
+
+        with pytest.raises(ValueError):
+            breaker.call(_refused)
+        assert breaker.state == CLOSED
+
+        with pytest.raises(ConnectionError):
+            breaker.call(_down)
+        assert breaker.state == OPEN